@@ -1,18 +1,45 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, PLATFORMS
+from .binary_sensor import JOB_BINARY_SENSORS
+from .const import (
+    CONF_CONSOLIDATED_JOB_ENTITIES_APPLIED,
+    DATA_FLEET,
+    DOMAIN,
+    FLEET_MAX_CONCURRENT_FETCHES,
+    PLATFORMS,
+)
 from .coordinator import BixBackupCoordinator
+from .fleet import BixFleetScheduler
+from .sensor import JOB_SENSORS
+from .services import async_setup_services
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    hass.data[DATA_FLEET] = BixFleetScheduler(hass, FLEET_MAX_CONCURRENT_FETCHES)
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    coordinator = BixBackupCoordinator(hass, entry)
+    fleet: BixFleetScheduler = hass.data[DATA_FLEET]
+    coordinator = BixBackupCoordinator(hass, entry, fleet)
     await coordinator.async_initialize()
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    fleet.async_add(coordinator)
+    if not coordinator.enable_fleet_sensors:
+        fleet.async_release_summary(entry.entry_id)
+    _async_apply_job_entity_mode(hass, entry, coordinator)
 
     async def _async_reload(updated_hass: HomeAssistant, updated_entry: ConfigEntry) -> None:
         await updated_hass.config_entries.async_reload(updated_entry.entry_id)
@@ -22,10 +49,49 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+@callback
+def _async_apply_job_entity_mode(hass: HomeAssistant, entry: ConfigEntry, coordinator: BixBackupCoordinator) -> None:
+    consolidated = coordinator.consolidated_job_entities
+    if entry.data.get(CONF_CONSOLIDATED_JOB_ENTITIES_APPLIED, False) == consolidated:
+        return
+    keys = [
+        *((Platform.SENSOR, key) for key, _ in JOB_SENSORS),
+        *((Platform.BINARY_SENSOR, key) for key, _ in JOB_BINARY_SENSORS),
+        (Platform.BUTTON, "run_backup"),
+    ]
+    job_ids = [job_id for job in coordinator.data.get("jobs", []) if (job_id := str(job.get("job_id", "")).strip())]
+    per_field = {(domain, f"bix_job_{job_id}_{key}") for job_id in job_ids for domain, key in keys}
+    status = {(Platform.SENSOR, f"bix_job_{job_id}_status") for job_id in job_ids}
+    registry = er.async_get(hass)
+    for reg_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        key = (reg_entry.domain, reg_entry.unique_id)
+        if key in per_field:
+            disable = consolidated
+        elif key in status:
+            disable = not consolidated
+        else:
+            continue
+        if disable and reg_entry.disabled_by is None:
+            registry.async_update_entity(reg_entry.entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION)
+        elif not disable and reg_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+            registry.async_update_entity(reg_entry.entity_id, disabled_by=None)
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_CONSOLIDATED_JOB_ENTITIES_APPLIED: consolidated}
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    coordinator: BixBackupCoordinator = hass.data[DOMAIN][entry.entry_id]
-    await coordinator.async_shutdown()
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    if unloaded:
-        hass.data[DOMAIN].pop(entry.entry_id)
-    return unloaded
+    if not unloaded:
+        return False
+    coordinator: BixBackupCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+    fleet: BixFleetScheduler = hass.data[DATA_FLEET]
+    fleet.async_remove(entry.entry_id)
+    if entry.disabled_by is not None:
+        fleet.async_release_summary(entry.entry_id)
+    await coordinator.async_shutdown()
+    return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    hass.data[DATA_FLEET].async_release_summary(entry.entry_id)
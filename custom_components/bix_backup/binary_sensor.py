@@ -9,6 +9,11 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN
 from .coordinator import BixBackupCoordinator
 
+JOB_BINARY_SENSORS = (
+    ("enabled", "Enabled"),
+    ("running", "Running"),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,8 +36,7 @@ async def async_setup_entry(
             job_id = str(job.get("job_id", "")).strip()
             if not job_id:
                 continue
-            entities.append(BixJobBinarySensor(coordinator, job_id, "enabled", "Enabled"))
-            entities.append(BixJobBinarySensor(coordinator, job_id, "running", "Running"))
+            entities.extend(BixJobBinarySensor(coordinator, job_id, key, label) for key, label in JOB_BINARY_SENSORS)
 
     async_add_entities(entities)
 
@@ -66,6 +70,7 @@ class BixJobBinarySensor(CoordinatorEntity[BixBackupCoordinator], BinarySensorEn
         self._label = label
         self._attr_name = f"BIX Job {coordinator.get_job_label(job_id)} {label}"
         self._attr_unique_id = f"bix_job_{job_id}_{key}"
+        self._attr_entity_registry_enabled_default = not coordinator.consolidated_job_entities
 
     @property
     def is_on(self) -> bool | None:
@@ -2,14 +2,18 @@ from __future__ import annotations
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, EVENT_ACTION_FAILED, EVENT_ACTION_SUCCEEDED
 from .coordinator import BixBackupCoordinator
 
+LEGACY_ALERT_BUTTON_PREFIX = "bix_alert_"
+LEGACY_ALERT_BUTTON_SUFFIXES = ("_ack", "_resolve")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -17,6 +21,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: BixBackupCoordinator = hass.data[DOMAIN][entry.entry_id]
+    _async_remove_legacy_alert_buttons(hass, entry)
     entities: list[ButtonEntity] = []
 
     if coordinator.enable_action_buttons and coordinator.actions_capable:
@@ -24,22 +29,30 @@ async def async_setup_entry(
             job_id = str(job.get("job_id", "")).strip()
             if job_id:
                 entities.append(BixRunBackupButton(coordinator, job_id))
-        for alert in coordinator.data.get("alerts", []):
-            alert_id = str(alert.get("id", "")).strip()
-            if not alert_id:
-                continue
-            entities.append(BixAlertAckButton(coordinator, alert_id))
-            entities.append(BixAlertResolveButton(coordinator, alert_id))
 
     async_add_entities(entities)
 
 
+@callback
+def _async_remove_legacy_alert_buttons(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    registry = er.async_get(hass)
+    for reg_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        unique_id = reg_entry.unique_id
+        if (
+            reg_entry.domain == "button"
+            and unique_id.startswith(LEGACY_ALERT_BUTTON_PREFIX)
+            and unique_id.endswith(LEGACY_ALERT_BUTTON_SUFFIXES)
+        ):
+            registry.async_remove(reg_entry.entity_id)
+
+
 class BixRunBackupButton(CoordinatorEntity[BixBackupCoordinator], ButtonEntity):
     def __init__(self, coordinator: BixBackupCoordinator, job_id: str) -> None:
         super().__init__(coordinator)
         self._job_id = job_id
         self._attr_name = f"BIX Job {coordinator.get_job_label(job_id)} Run Backup"
         self._attr_unique_id = f"bix_job_{job_id}_run_backup"
+        self._attr_entity_registry_enabled_default = not coordinator.consolidated_job_entities
 
     @property
     def available(self) -> bool:
@@ -54,12 +67,12 @@ class BixRunBackupButton(CoordinatorEntity[BixBackupCoordinator], ButtonEntity):
         try:
             await self.coordinator.async_run_backup(self._job_id)
             self.hass.bus.async_fire(
-                "bix_backup_action_succeeded",
+                EVENT_ACTION_SUCCEEDED,
                 {"action": "run_backup", "job_id": self._job_id},
             )
         except Exception as err:
             self.hass.bus.async_fire(
-                "bix_backup_action_failed",
+                EVENT_ACTION_FAILED,
                 {"action": "run_backup", "job_id": self._job_id, "error": str(err)},
             )
             raise HomeAssistantError(str(err)) from err
@@ -67,83 +80,3 @@ class BixRunBackupButton(CoordinatorEntity[BixBackupCoordinator], ButtonEntity):
     @property
     def name(self) -> str | None:
         return f"BIX Job {self.coordinator.get_job_label(self._job_id)} Run Backup"
-
-
-class BixAlertAckButton(CoordinatorEntity[BixBackupCoordinator], ButtonEntity):
-    def __init__(self, coordinator: BixBackupCoordinator, alert_id: str) -> None:
-        super().__init__(coordinator)
-        self._alert_id = alert_id
-        self._attr_name = f"BIX Alert {alert_id} Acknowledge"
-        self._attr_unique_id = f"bix_alert_{alert_id}_ack"
-
-    @property
-    def available(self) -> bool:
-        if not super().available:
-            return False
-        alert = self.coordinator.get_alert(self._alert_id)
-        if alert is None:
-            return False
-        return bool(alert.get("can_ack"))
-
-    async def async_press(self) -> None:
-        try:
-            await self.coordinator.async_ack_alert(self._alert_id)
-            self.hass.bus.async_fire(
-                "bix_backup_action_succeeded",
-                {"action": "ack", "alert_id": self._alert_id},
-            )
-        except Exception as err:
-            self.hass.bus.async_fire(
-                "bix_backup_action_failed",
-                {"action": "ack", "alert_id": self._alert_id, "error": str(err)},
-            )
-            raise HomeAssistantError(str(err)) from err
-
-    @property
-    def name(self) -> str | None:
-        alert = self.coordinator.get_alert(self._alert_id)
-        if isinstance(alert, dict):
-            job_id = str(alert.get("job_id", "")).strip()
-            if job_id:
-                return f"BIX Alert {self.coordinator.get_job_label(job_id)} Acknowledge"
-        return f"BIX Alert {self._alert_id} Acknowledge"
-
-
-class BixAlertResolveButton(CoordinatorEntity[BixBackupCoordinator], ButtonEntity):
-    def __init__(self, coordinator: BixBackupCoordinator, alert_id: str) -> None:
-        super().__init__(coordinator)
-        self._alert_id = alert_id
-        self._attr_name = f"BIX Alert {alert_id} Resolve"
-        self._attr_unique_id = f"bix_alert_{alert_id}_resolve"
-
-    @property
-    def available(self) -> bool:
-        if not super().available:
-            return False
-        alert = self.coordinator.get_alert(self._alert_id)
-        if alert is None:
-            return False
-        return bool(alert.get("can_resolve"))
-
-    async def async_press(self) -> None:
-        try:
-            await self.coordinator.async_resolve_alert(self._alert_id)
-            self.hass.bus.async_fire(
-                "bix_backup_action_succeeded",
-                {"action": "resolve", "alert_id": self._alert_id},
-            )
-        except Exception as err:
-            self.hass.bus.async_fire(
-                "bix_backup_action_failed",
-                {"action": "resolve", "alert_id": self._alert_id, "error": str(err)},
-            )
-            raise HomeAssistantError(str(err)) from err
-
-    @property
-    def name(self) -> str | None:
-        alert = self.coordinator.get_alert(self._alert_id)
-        if isinstance(alert, dict):
-            job_id = str(alert.get("job_id", "")).strip()
-            if job_id:
-                return f"BIX Alert {self.coordinator.get_job_label(job_id)} Resolve"
-        return f"BIX Alert {self._alert_id} Resolve"
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import random
+import time
+from typing import Any
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class BixCircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int,
+        slow_call_seconds: float,
+        open_seconds: float,
+        max_open_seconds: float,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._slow_call_seconds = slow_call_seconds
+        self._base_open_seconds = open_seconds
+        self._max_open_seconds = max_open_seconds
+        self._open_seconds = open_seconds
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+        self._times_opened = 0
+        self._rejected = 0
+        self._last_failure: str | None = None
+
+    @property
+    def state(self) -> str:
+        if self._state == STATE_OPEN and self._open_expired():
+            return STATE_HALF_OPEN
+        return self._state
+
+    @property
+    def probe_in_flight(self) -> bool:
+        return self._probe_in_flight
+
+    def _open_expired(self) -> bool:
+        return self._opened_at is not None and time.monotonic() - self._opened_at >= self._open_seconds
+
+    def allow_request(self) -> bool:
+        if self._state == STATE_CLOSED:
+            return True
+        if self._state == STATE_OPEN:
+            if not self._open_expired():
+                self._rejected += 1
+                return False
+            self._state = STATE_HALF_OPEN
+        if self._probe_in_flight:
+            self._rejected += 1
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self, elapsed: float) -> None:
+        if elapsed >= self._slow_call_seconds:
+            self.record_failure(f"slow response ({elapsed:.1f}s)")
+            return
+        self._probe_in_flight = False
+        self._consecutive_failures = 0
+        self._state = STATE_CLOSED
+        self._opened_at = None
+        self._open_seconds = self._base_open_seconds
+
+    def release_probe(self) -> None:
+        self._probe_in_flight = False
+
+    def record_failure(self, reason: str) -> None:
+        self._last_failure = reason
+        self._consecutive_failures += 1
+        if self._state == STATE_HALF_OPEN:
+            self._probe_in_flight = False
+            self._open_seconds = min(self._open_seconds * 2, self._max_open_seconds)
+            self._trip()
+        elif self._state == STATE_CLOSED and self._consecutive_failures >= self._failure_threshold:
+            self._trip()
+
+    def _trip(self) -> None:
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        retry_in = None
+        if self._state == STATE_OPEN and self._opened_at is not None:
+            retry_in = max(0.0, round(self._opened_at + self._open_seconds - time.monotonic(), 1))
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "times_opened": self._times_opened,
+            "rejected_requests": self._rejected,
+            "open_seconds": self._open_seconds,
+            "retry_in_seconds": retry_in,
+            "last_failure": self._last_failure,
+        }
+
+
+class BixRetryBudget:
+    def __init__(self, max_tokens: float, deposit_per_request: float, initial_tokens: float) -> None:
+        self._max_tokens = max_tokens
+        self._deposit = deposit_per_request
+        self._tokens = initial_tokens
+        self._retries = 0
+        self._exhausted = 0
+
+    def record_request(self) -> None:
+        self._tokens = min(self._max_tokens, self._tokens + self._deposit)
+
+    def try_withdraw(self) -> bool:
+        if self._tokens < 1:
+            self._exhausted += 1
+            return False
+        self._tokens -= 1
+        self._retries += 1
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "tokens": round(self._tokens, 2),
+            "retries": self._retries,
+            "exhausted": self._exhausted,
+        }
+
+
+def backoff_with_jitter(attempt: int, base: float, cap: float) -> float:
+    return random.uniform(0, min(cap, base * (2**attempt)))
@@ -13,20 +13,28 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .const import (
     CONF_BASE_URL,
     CONF_TOKEN,
+    DEFAULT_CONSOLIDATED_JOB_ENTITIES,
     DEFAULT_DRIFT_POLL_SECONDS,
     DEFAULT_ENABLE_ACTION_BUTTONS,
     DEFAULT_ENABLE_ALERT_ENTITIES,
+    DEFAULT_ENABLE_FLEET_SENSORS,
     DEFAULT_ENABLE_HOST_ENTITIES,
     DEFAULT_ENABLE_JOB_ENTITIES,
     DEFAULT_POLL_FALLBACK_SECONDS,
+    DEFAULT_RECORD_TRAFFIC,
+    DEFAULT_WS_FILTER_BY_ENTITY_GROUPS,
     DISCOVERY_PATH,
     DOMAIN,
+    OPT_CONSOLIDATED_JOB_ENTITIES,
     OPT_DRIFT_POLL_SECONDS,
     OPT_ENABLE_ACTION_BUTTONS,
     OPT_ENABLE_ALERT_ENTITIES,
+    OPT_ENABLE_FLEET_SENSORS,
     OPT_ENABLE_HOST_ENTITIES,
     OPT_ENABLE_JOB_ENTITIES,
     OPT_POLL_FALLBACK_SECONDS,
+    OPT_RECORD_TRAFFIC,
+    OPT_WS_FILTER_BY_ENTITY_GROUPS,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -88,8 +96,12 @@ class BixBackupConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         OPT_DRIFT_POLL_SECONDS: DEFAULT_DRIFT_POLL_SECONDS,
                         OPT_ENABLE_HOST_ENTITIES: DEFAULT_ENABLE_HOST_ENTITIES,
                         OPT_ENABLE_JOB_ENTITIES: DEFAULT_ENABLE_JOB_ENTITIES,
+                        OPT_CONSOLIDATED_JOB_ENTITIES: DEFAULT_CONSOLIDATED_JOB_ENTITIES,
                         OPT_ENABLE_ALERT_ENTITIES: DEFAULT_ENABLE_ALERT_ENTITIES,
                         OPT_ENABLE_ACTION_BUTTONS: DEFAULT_ENABLE_ACTION_BUTTONS,
+                        OPT_ENABLE_FLEET_SENSORS: DEFAULT_ENABLE_FLEET_SENSORS,
+                        OPT_WS_FILTER_BY_ENTITY_GROUPS: DEFAULT_WS_FILTER_BY_ENTITY_GROUPS,
+                        OPT_RECORD_TRAFFIC: DEFAULT_RECORD_TRAFFIC,
                     },
                 )
 
@@ -135,6 +147,10 @@ class BixBackupOptionsFlow(config_entries.OptionsFlow):
                     OPT_ENABLE_JOB_ENTITIES,
                     default=options.get(OPT_ENABLE_JOB_ENTITIES, DEFAULT_ENABLE_JOB_ENTITIES),
                 ): bool,
+                vol.Required(
+                    OPT_CONSOLIDATED_JOB_ENTITIES,
+                    default=options.get(OPT_CONSOLIDATED_JOB_ENTITIES, DEFAULT_CONSOLIDATED_JOB_ENTITIES),
+                ): bool,
                 vol.Required(
                     OPT_ENABLE_ALERT_ENTITIES,
                     default=options.get(OPT_ENABLE_ALERT_ENTITIES, DEFAULT_ENABLE_ALERT_ENTITIES),
@@ -143,6 +159,18 @@ class BixBackupOptionsFlow(config_entries.OptionsFlow):
                     OPT_ENABLE_ACTION_BUTTONS,
                     default=options.get(OPT_ENABLE_ACTION_BUTTONS, DEFAULT_ENABLE_ACTION_BUTTONS),
                 ): bool,
+                vol.Required(
+                    OPT_ENABLE_FLEET_SENSORS,
+                    default=options.get(OPT_ENABLE_FLEET_SENSORS, DEFAULT_ENABLE_FLEET_SENSORS),
+                ): bool,
+                vol.Required(
+                    OPT_WS_FILTER_BY_ENTITY_GROUPS,
+                    default=options.get(OPT_WS_FILTER_BY_ENTITY_GROUPS, DEFAULT_WS_FILTER_BY_ENTITY_GROUPS),
+                ): bool,
+                vol.Required(
+                    OPT_RECORD_TRAFFIC,
+                    default=options.get(OPT_RECORD_TRAFFIC, DEFAULT_RECORD_TRAFFIC),
+                ): bool,
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
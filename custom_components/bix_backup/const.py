@@ -12,6 +12,7 @@ PLATFORMS: list[Platform] = [
 
 CONF_BASE_URL = "base_url"
 CONF_TOKEN = "token"
+CONF_CONSOLIDATED_JOB_ENTITIES_APPLIED = "consolidated_job_entities_applied"
 
 OPT_POLL_FALLBACK_SECONDS = "poll_fallback_seconds"
 OPT_DRIFT_POLL_SECONDS = "drift_poll_seconds"
@@ -19,6 +20,10 @@ OPT_ENABLE_HOST_ENTITIES = "enable_host_entities"
 OPT_ENABLE_JOB_ENTITIES = "enable_job_entities"
 OPT_ENABLE_ALERT_ENTITIES = "enable_alert_entities"
 OPT_ENABLE_ACTION_BUTTONS = "enable_action_buttons"
+OPT_ENABLE_FLEET_SENSORS = "enable_fleet_sensors"
+OPT_RECORD_TRAFFIC = "record_traffic"
+OPT_CONSOLIDATED_JOB_ENTITIES = "consolidated_job_entities"
+OPT_WS_FILTER_BY_ENTITY_GROUPS = "ws_filter_by_entity_groups"
 
 DEFAULT_POLL_FALLBACK_SECONDS = 30
 DEFAULT_DRIFT_POLL_SECONDS = 300
@@ -26,10 +31,86 @@ DEFAULT_ENABLE_HOST_ENTITIES = True
 DEFAULT_ENABLE_JOB_ENTITIES = True
 DEFAULT_ENABLE_ALERT_ENTITIES = True
 DEFAULT_ENABLE_ACTION_BUTTONS = True
+DEFAULT_ENABLE_FLEET_SENSORS = False
+DEFAULT_RECORD_TRAFFIC = False
+DEFAULT_CONSOLIDATED_JOB_ENTITIES = False
+DEFAULT_WS_FILTER_BY_ENTITY_GROUPS = False
+
+DATA_FLEET = f"{DOMAIN}_fleet"
+FLEET_MAX_CONCURRENT_FETCHES = 2
+
+REQUEST_REFRESH_COOLDOWN_SECONDS = 10.0
+LOAD_SHED_ENTER_MS = (50.0, 100.0, 200.0, 400.0)
+LOAD_SHED_EXIT_RATIO = 0.6
+LOAD_SHED_REFRESH_COOLDOWN_SECONDS = 30.0
+LOAD_SHED_WRITE_BATCH_SECONDS = 2.0
+LOAD_SHED_POLL_MULTIPLIER = 4
 
 DISCOVERY_PATH = "/api/integrations/home-assistant/discovery"
 STATE_PATH = "/api/integrations/home-assistant/state"
+STATE_JOBS_PATH = f"{STATE_PATH}/jobs"
+STATE_ALERTS_PATH = f"{STATE_PATH}/alerts"
 ACTIONS_BASE_PATH = "/api/integrations/home-assistant/actions"
 WS_PATH = "/ws/ui"
 
 SUPPORTED_WS_EVENTS = {"host", "job", "alerts", "config"}
+WS_EVENT_RECORD_TYPES = {"host": "hosts", "job": "jobs", "alerts": "alerts"}
+WS_SUBSCRIBE_MAX_IDS = 500
+
+API_GET_TIMEOUT_SECONDS = 15
+STATE_STREAM_THRESHOLD_BYTES = 1_048_576
+STATE_READ_CHUNK_BYTES = 262_144
+API_POST_TIMEOUT_SECONDS = 30
+API_MAX_GET_ATTEMPTS = 3
+API_RETRY_BACKOFF_BASE_SECONDS = 0.5
+API_RETRY_BACKOFF_MAX_SECONDS = 5.0
+API_RETRY_BUDGET_MAX_TOKENS = 10.0
+API_RETRY_BUDGET_DEPOSIT = 0.2
+API_RETRY_BUDGET_INITIAL_TOKENS = 3.0
+
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_SLOW_CALL_SECONDS = 10.0
+BREAKER_OPEN_SECONDS = 15.0
+BREAKER_MAX_OPEN_SECONDS = 300.0
+
+DRIFT_MIN_SECONDS = 30
+DRIFT_MAX_SECONDS = 3600
+DRIFT_LENGTHEN_FACTOR = 1.5
+DRIFT_SHORTEN_FACTOR = 0.5
+DRIFT_RATE_EWMA_ALPHA = 0.2
+DRIFT_RATE_LOW = 0.1
+DRIFT_RATE_HIGH = 0.3
+DRIFT_RECENT_RECORDS = 20
+
+EVENT_ACTION_SUCCEEDED = f"{DOMAIN}_action_succeeded"
+EVENT_ACTION_FAILED = f"{DOMAIN}_action_failed"
+EVENT_JOB_STARTED = f"{DOMAIN}_job_started"
+EVENT_JOB_FINISHED = f"{DOMAIN}_job_finished"
+EVENT_ALERT_OPENED = f"{DOMAIN}_alert_opened"
+EVENT_ALERT_CLOSED = f"{DOMAIN}_alert_closed"
+EVENT_HOST_CONNECTED = f"{DOMAIN}_host_connected"
+EVENT_HOST_DISCONNECTED = f"{DOMAIN}_host_disconnected"
+
+SERVICE_RUN_BACKUP = "run_backup"
+SERVICE_ACK_ALERT = "ack_alert"
+SERVICE_RESOLVE_ALERT = "resolve_alert"
+SERVICE_GET_ALERTS = "get_alerts"
+SERVICE_PROFILE = "profile"
+DEFAULT_PROFILE_DURATION_SECONDS = 60
+DEFAULT_PROFILE_MAX_CALLS = 100
+
+ALERT_SEVERITIES = ("critical", "warning", "info")
+ALERT_FEED_PAGE_SIZE = 25
+ALERT_SERVICE_MAX_PAGE_SIZE = 500
+ALERT_FEED_FIELDS = (
+    "id",
+    "job_id",
+    "host_id",
+    "severity",
+    "status",
+    "title",
+    "message",
+    "created_at",
+    "can_ack",
+    "can_resolve",
+)
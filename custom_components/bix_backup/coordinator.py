@@ -1,47 +1,247 @@
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Callable, Coroutine, Iterable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from itertools import islice
+import json
 import logging
+import time
 from typing import Any
+from urllib.parse import quote
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .circuit_breaker import BixCircuitBreaker, BixRetryBudget, backoff_with_jitter
 from .const import (
     ACTIONS_BASE_PATH,
+    ALERT_SEVERITIES,
+    API_GET_TIMEOUT_SECONDS,
+    API_MAX_GET_ATTEMPTS,
+    API_POST_TIMEOUT_SECONDS,
+    API_RETRY_BACKOFF_BASE_SECONDS,
+    API_RETRY_BACKOFF_MAX_SECONDS,
+    API_RETRY_BUDGET_DEPOSIT,
+    API_RETRY_BUDGET_INITIAL_TOKENS,
+    API_RETRY_BUDGET_MAX_TOKENS,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_OPEN_SECONDS,
+    BREAKER_OPEN_SECONDS,
+    BREAKER_SLOW_CALL_SECONDS,
     CONF_BASE_URL,
     CONF_TOKEN,
+    DEFAULT_CONSOLIDATED_JOB_ENTITIES,
     DEFAULT_DRIFT_POLL_SECONDS,
     DEFAULT_ENABLE_ACTION_BUTTONS,
     DEFAULT_ENABLE_ALERT_ENTITIES,
+    DEFAULT_ENABLE_FLEET_SENSORS,
     DEFAULT_ENABLE_HOST_ENTITIES,
     DEFAULT_ENABLE_JOB_ENTITIES,
     DEFAULT_POLL_FALLBACK_SECONDS,
+    DEFAULT_RECORD_TRAFFIC,
+    DEFAULT_WS_FILTER_BY_ENTITY_GROUPS,
     DISCOVERY_PATH,
+    DRIFT_LENGTHEN_FACTOR,
+    DRIFT_MAX_SECONDS,
+    DRIFT_MIN_SECONDS,
+    DRIFT_RATE_EWMA_ALPHA,
+    DRIFT_RATE_HIGH,
+    DRIFT_RATE_LOW,
+    DRIFT_RECENT_RECORDS,
+    DRIFT_SHORTEN_FACTOR,
+    EVENT_ALERT_CLOSED,
+    EVENT_ALERT_OPENED,
+    EVENT_HOST_CONNECTED,
+    EVENT_HOST_DISCONNECTED,
+    EVENT_JOB_FINISHED,
+    EVENT_JOB_STARTED,
+    LOAD_SHED_POLL_MULTIPLIER,
+    LOAD_SHED_REFRESH_COOLDOWN_SECONDS,
+    LOAD_SHED_WRITE_BATCH_SECONDS,
+    OPT_CONSOLIDATED_JOB_ENTITIES,
     OPT_DRIFT_POLL_SECONDS,
     OPT_ENABLE_ACTION_BUTTONS,
     OPT_ENABLE_ALERT_ENTITIES,
+    OPT_ENABLE_FLEET_SENSORS,
     OPT_ENABLE_HOST_ENTITIES,
     OPT_ENABLE_JOB_ENTITIES,
     OPT_POLL_FALLBACK_SECONDS,
+    OPT_RECORD_TRAFFIC,
+    OPT_WS_FILTER_BY_ENTITY_GROUPS,
+    REQUEST_REFRESH_COOLDOWN_SECONDS,
+    STATE_ALERTS_PATH,
+    STATE_JOBS_PATH,
     STATE_PATH,
+    STATE_READ_CHUNK_BYTES,
+    STATE_STREAM_THRESHOLD_BYTES,
     SUPPORTED_WS_EVENTS,
+    WS_EVENT_RECORD_TYPES,
+    WS_SUBSCRIBE_MAX_IDS,
 )
+from .drift import BixDriftAuditor
+from .fleet import BixFleetScheduler
+from .json_stream import loads_incremental
+from .load_shedding import (
+    SHED_LEVEL_BATCH_WRITES,
+    SHED_LEVEL_COALESCE_REFRESHES,
+    SHED_LEVEL_NONE,
+    SHED_LEVEL_SLOW_POLLS,
+    SHED_LEVEL_SUSPEND_DIAGNOSTICS,
+)
+from .loop_lag import BixLoopStallSampler
+from .profiler import (
+    SECTION_DISPATCH,
+    SECTION_PROCESS_STATE,
+    SECTION_UPDATE_DATA,
+    SECTION_WS_EVENT,
+    BixProfileSession,
+)
+from .traffic import BixTrafficRecorder
 from .ws_client import BixWsClient
 
 _LOGGER = logging.getLogger(__name__)
 
+StateIndex = dict[str, dict[str, dict[str, Any]]]
+
+
+def _index_records(records: Any, key: str) -> dict[str, dict[str, Any]]:
+    index: dict[str, dict[str, Any]] = {}
+    if not isinstance(records, list):
+        return index
+    for rec in records:
+        if not isinstance(rec, dict):
+            continue
+        rec_id = str(rec.get(key, "")).strip()
+        if rec_id:
+            index[rec_id] = rec
+    return index
+
+
+def alert_severity(alert: dict[str, Any]) -> str:
+    return str(alert.get("severity", "")).strip().lower() or "info"
+
+
+def alert_is_open(alert: dict[str, Any]) -> bool:
+    return str(alert.get("status") or "open").strip().lower() == "open"
+
+
+def _group_alerts(index: StateIndex, alert_id: str, alert: dict[str, Any]) -> None:
+    if not alert_is_open(alert):
+        return
+    index["open_alerts"][alert_id] = alert
+    index["alerts_by_severity"].setdefault(alert_severity(alert), {})[alert_id] = alert
+    job_id = str(alert.get("job_id", "")).strip()
+    if job_id:
+        index["alerts_by_job"].setdefault(job_id, {})[alert_id] = alert
+
+
+def _ungroup_alert(index: StateIndex, alert_id: str, alert: dict[str, Any]) -> None:
+    index["open_alerts"].pop(alert_id, None)
+    severity = alert_severity(alert)
+    group = index["alerts_by_severity"].get(severity)
+    if group is not None:
+        group.pop(alert_id, None)
+    job_id = str(alert.get("job_id", "")).strip()
+    group = index["alerts_by_job"].get(job_id)
+    if group is not None:
+        group.pop(alert_id, None)
+        if not group:
+            index["alerts_by_job"].pop(job_id)
+
+
+def _adjust_alert_summary(summary: dict[str, Any], alert: dict[str, Any] | None, delta: int) -> None:
+    if alert is None or not alert_is_open(alert):
+        return
+    keys = ["open_alerts_total"]
+    severity = alert_severity(alert)
+    if severity in ALERT_SEVERITIES:
+        keys.append(f"open_alerts_{severity}")
+    for key in keys:
+        count = summary.get(key)
+        if isinstance(count, int):
+            summary[key] = max(count + delta, 0)
+
+
+def _empty_index() -> StateIndex:
+    return {
+        "hosts": {},
+        "jobs": {},
+        "alerts": {},
+        "open_alerts": {},
+        "alerts_by_severity": {},
+        "alerts_by_job": {},
+    }
+
+
+def build_state_index(payload: dict[str, Any]) -> StateIndex:
+    index = _empty_index()
+    index["hosts"] = _index_records(payload.get("hosts"), "id")
+    index["jobs"] = _index_records(payload.get("jobs"), "job_id")
+    index["alerts"] = _index_records(payload.get("alerts"), "id")
+    for alert_id, alert in index["alerts"].items():
+        _group_alerts(index, alert_id, alert)
+    return index
+
+
+def _decode_state(body: bytes | bytearray, incremental: bool = False) -> tuple[dict[str, Any], StateIndex]:
+    if incremental:
+        text = body.decode("utf-8")
+        if isinstance(body, bytearray):
+            body.clear()
+        payload = loads_incremental(text)
+        del text
+    else:
+        payload = json.loads(body)
+    if not isinstance(payload, dict) or payload.get("schema_version") != 1:
+        raise HomeAssistantError("Unsupported schema version")
+    return payload, build_state_index(payload)
+
+
+def _timed_decode_state(body: bytes | bytearray) -> tuple[tuple[dict[str, Any], StateIndex], float]:
+    started = time.perf_counter()
+    result = _decode_state(body, incremental=True)
+    return result, (time.perf_counter() - started) * 1000
+
+
+class _RetryableError(Exception):
+    pass
+
 
 class BixApiClient:
-    def __init__(self, session: aiohttp.ClientSession, base_url: str, token: str) -> None:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str,
+        token: str,
+        fetch_slot: Callable[[], AbstractAsyncContextManager[Any]] = nullcontext,
+    ) -> None:
         self._session = session
+        self._fetch_slot = fetch_slot
         self._base_url = base_url.rstrip("/")
         self._token = token
+        self._breaker = BixCircuitBreaker(
+            BREAKER_FAILURE_THRESHOLD,
+            BREAKER_SLOW_CALL_SECONDS,
+            BREAKER_OPEN_SECONDS,
+            BREAKER_MAX_OPEN_SECONDS,
+        )
+        self._retry_budget = BixRetryBudget(
+            API_RETRY_BUDGET_MAX_TOKENS,
+            API_RETRY_BUDGET_DEPOSIT,
+            API_RETRY_BUDGET_INITIAL_TOKENS,
+        )
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self._deduplicated_gets = 0
+        self._ingest_stats: dict[str, dict[str, Any]] = {}
+        self.recorder: BixTrafficRecorder | None = None
 
     @property
     def base_url(self) -> str:
@@ -53,48 +253,204 @@ class BixApiClient:
     def _url(self, path: str) -> str:
         return f"{self._base_url}{path}"
 
-    async def fetch_discovery(self) -> dict[str, Any]:
-        async with self._session.get(self._url(DISCOVERY_PATH), headers=self._headers(), timeout=15) as resp:
-            if resp.status >= 400:
-                raise HomeAssistantError(f"Discovery failed with status {resp.status}")
-            payload = await resp.json()
-        if payload.get("schema_version") != 1:
-            raise HomeAssistantError("Unsupported schema version")
+    def diagnostics(self) -> dict[str, Any]:
+        return {
+            "circuit_breaker": self._breaker.as_dict(),
+            "retry_budget": self._retry_budget.as_dict(),
+            "inflight_gets": sorted(self._inflight),
+            "deduplicated_gets": self._deduplicated_gets,
+            "state_ingest": self._ingest_stats,
+        }
+
+    async def _get_json(self, path: str, label: str, missing_ok: bool = False, ingest_state: bool = False) -> Any:
+        task = self._inflight.get(path)
+        if task is not None:
+            self._deduplicated_gets += 1
+        else:
+            task = asyncio.create_task(
+                self._get_json_with_retry(path, label, missing_ok, ingest_state),
+                name=f"bix_backup_get {path}",
+            )
+            self._inflight[path] = task
+            task.add_done_callback(lambda _: self._inflight.pop(path, None))
+        return await asyncio.shield(task)
+
+    async def _get_json_with_retry(self, path: str, label: str, missing_ok: bool, ingest_state: bool) -> Any:
+        self._retry_budget.record_request()
+        attempt = 0
+        while True:
+            try:
+                return await self._get_json_once(path, label, missing_ok, ingest_state)
+            except _RetryableError as err:
+                attempt += 1
+                if attempt >= API_MAX_GET_ATTEMPTS or not self._retry_budget.try_withdraw():
+                    raise HomeAssistantError(str(err)) from err
+                delay = backoff_with_jitter(attempt, API_RETRY_BACKOFF_BASE_SECONDS, API_RETRY_BACKOFF_MAX_SECONDS)
+                _LOGGER.debug("Retrying BIX %s in %.2fs: %s", label, delay, err)
+                await asyncio.sleep(delay)
+
+    async def _get_json_once(self, path: str, label: str, missing_ok: bool, ingest_state: bool) -> Any:
+        if not self._breaker.allow_request():
+            raise HomeAssistantError(f"{label} skipped: controller circuit breaker is open")
+        probing = self._breaker.probe_in_flight
+        sampler: BixLoopStallSampler | None = None
+        recorded: bytes | None = None
+        try:
+            async with self._fetch_slot():
+                started = time.monotonic()
+                async with self._session.get(
+                    self._url(path),
+                    headers=self._headers(),
+                    timeout=API_GET_TIMEOUT_SECONDS,
+                ) as resp:
+                    if resp.status >= 500:
+                        raise _RetryableError(f"{label} failed with status {resp.status}")
+                    if resp.status == 404 and missing_ok:
+                        self._breaker.record_success(time.monotonic() - started)
+                        return None
+                    if resp.status >= 400:
+                        self._breaker.record_success(time.monotonic() - started)
+                        raise HomeAssistantError(f"{label} failed with status {resp.status}")
+                    status = resp.status
+                    if ingest_state:
+                        sampler = BixLoopStallSampler(asyncio.get_running_loop())
+                        sampler.start()
+                        body = await self._read_body(resp)
+                        if self.recorder is not None:
+                            recorded = bytes(body)
+                    else:
+                        payload = await resp.json()
+                        if self.recorder is not None:
+                            recorded = await resp.read()
+            self._breaker.record_success(time.monotonic() - started)
+            if ingest_state:
+                payload = await self._ingest_state(body, sampler)
+                del body
+        except _RetryableError as err:
+            self._breaker.record_failure(str(err))
+            raise
+        except (aiohttp.ClientError, TimeoutError, ValueError) as err:
+            self._breaker.record_failure(f"{type(err).__name__}: {err}")
+            raise _RetryableError(f"{label} failed: {err}") from err
+        finally:
+            if sampler is not None:
+                sampler.stop()
+            if probing:
+                self._breaker.release_probe()
+        if self.recorder is not None and recorded is not None:
+            self.recorder.record_http(path, status, recorded)
         return payload
 
-    async def fetch_state(self) -> dict[str, Any]:
-        async with self._session.get(self._url(STATE_PATH), headers=self._headers(), timeout=15) as resp:
-            if resp.status >= 400:
-                raise HomeAssistantError(f"State failed with status {resp.status}")
-            payload = await resp.json()
+    async def _read_body(self, resp: aiohttp.ClientResponse) -> bytes | bytearray:
+        if resp.content_length is not None and resp.content_length < STATE_STREAM_THRESHOLD_BYTES:
+            return await resp.read()
+        body = bytearray()
+        async for chunk in resp.content.iter_chunked(STATE_READ_CHUNK_BYTES):
+            body.extend(chunk)
+        return body
+
+    async def _ingest_state(
+        self, body: bytes | bytearray, sampler: BixLoopStallSampler
+    ) -> tuple[dict[str, Any], StateIndex]:
+        size = len(body)
+        if size < STATE_STREAM_THRESHOLD_BYTES:
+            mode = "inline"
+            started = time.perf_counter()
+            result = _decode_state(body)
+            decode_ms = (time.perf_counter() - started) * 1000
+        else:
+            mode = "executor"
+            loop = asyncio.get_running_loop()
+            result, decode_ms = await loop.run_in_executor(None, _timed_decode_state, body)
+        sampler.stop()
+
+        stats = self._ingest_stats.setdefault(mode, {"count": 0, "max_loop_stall_ms": 0.0})
+        stats["count"] += 1
+        stats["last_bytes"] = size
+        stats["last_decode_ms"] = round(decode_ms, 2)
+        stats["last_loop_stall_ms"] = round(sampler.max_stall_ms, 2)
+        stats["max_loop_stall_ms"] = round(max(stats["max_loop_stall_ms"], sampler.max_stall_ms), 2)
+        stats["last_stall_samples"] = sampler.samples
+        if sampler.rss_start is not None and sampler.rss_peak is not None and sampler.rss_end is not None:
+            stats["last_rss_delta_mib"] = round((sampler.rss_end - sampler.rss_start) / 1_048_576, 1)
+            stats["last_sampled_peak_rss_delta_mib"] = round((sampler.rss_peak - sampler.rss_start) / 1_048_576, 1)
+        return result
+
+    async def fetch_discovery(self) -> dict[str, Any]:
+        payload = await self._get_json(DISCOVERY_PATH, "Discovery")
         if payload.get("schema_version") != 1:
             raise HomeAssistantError("Unsupported schema version")
         return payload
 
+    async def fetch_state(self) -> tuple[dict[str, Any], StateIndex]:
+        return await self._get_json(STATE_PATH, "State", ingest_state=True)
+
+    async def fetch_job(self, job_id: str) -> dict[str, Any] | None:
+        return await self._fetch_resource(f"{STATE_JOBS_PATH}/{quote(job_id, safe='')}", "Job", "job")
+
+    async def fetch_alert(self, alert_id: str) -> dict[str, Any] | None:
+        return await self._fetch_resource(f"{STATE_ALERTS_PATH}/{quote(alert_id, safe='')}", "Alert", "alert")
+
+    async def _fetch_resource(self, path: str, label: str, key: str) -> dict[str, Any] | None:
+        payload = await self._get_json(path, label, missing_ok=True)
+        if payload is None:
+            return None
+        if not isinstance(payload, dict):
+            raise HomeAssistantError(f"Invalid {key} payload")
+        record = payload.get(key, payload)
+        if not isinstance(record, dict):
+            raise HomeAssistantError(f"Invalid {key} payload")
+        return record
+
     async def post_action(self, path: str) -> dict[str, Any]:
-        async with self._session.post(self._url(path), headers=self._headers(), timeout=30) as resp:
-            payload = await resp.json(content_type=None)
-            if resp.status >= 400:
-                detail = payload.get("error") if isinstance(payload, dict) else f"status {resp.status}"
-                raise HomeAssistantError(f"Action failed: {detail}")
-            if not isinstance(payload, dict):
-                raise HomeAssistantError("Invalid action payload")
-            return payload
+        if not self._breaker.allow_request():
+            raise HomeAssistantError("Action skipped: controller circuit breaker is open")
+        probing = self._breaker.probe_in_flight
+        started = time.monotonic()
+        try:
+            async with self._session.post(
+                self._url(path),
+                headers=self._headers(),
+                timeout=API_POST_TIMEOUT_SECONDS,
+            ) as resp:
+                payload = await resp.json(content_type=None)
+                status = resp.status
+        except (aiohttp.ClientError, TimeoutError, ValueError) as err:
+            self._breaker.record_failure(f"{type(err).__name__}: {err}")
+            raise HomeAssistantError(f"Action failed: {err}") from err
+        finally:
+            if probing:
+                self._breaker.release_probe()
+        if status >= 500:
+            self._breaker.record_failure(f"Action failed with status {status}")
+        else:
+            self._breaker.record_success(time.monotonic() - started)
+        if status >= 400:
+            detail = payload.get("error") if isinstance(payload, dict) else f"status {status}"
+            raise HomeAssistantError(f"Action failed: {detail}")
+        if not isinstance(payload, dict):
+            raise HomeAssistantError("Invalid action payload")
+        return payload
 
 
 class BixBackupCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, fleet: BixFleetScheduler) -> None:
         self.hass = hass
         self.entry = entry
+        self.fleet = fleet
         self.session = async_get_clientsession(hass)
         self.api = BixApiClient(
             self.session,
             str(entry.data[CONF_BASE_URL]).strip().rstrip("/"),
             str(entry.data[CONF_TOKEN]).strip(),
+            fleet.fetch_slot,
         )
         self.discovery: dict[str, Any] = {}
         self.ws_connected = False
         self._ws_client: BixWsClient | None = None
+        self._index: StateIndex | None = None
+        self._pending_bus_events: list[tuple[str, dict[str, Any]]] = []
+        self.profile_session: BixProfileSession | None = None
 
         self.poll_fallback_seconds = int(
             entry.options.get(OPT_POLL_FALLBACK_SECONDS, DEFAULT_POLL_FALLBACK_SECONDS)
@@ -110,14 +466,70 @@ class BixBackupCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.enable_action_buttons = bool(
             entry.options.get(OPT_ENABLE_ACTION_BUTTONS, DEFAULT_ENABLE_ACTION_BUTTONS)
         )
+        self.enable_fleet_sensors = bool(
+            entry.options.get(OPT_ENABLE_FLEET_SENSORS, DEFAULT_ENABLE_FLEET_SENSORS)
+        )
+        self.record_traffic = bool(entry.options.get(OPT_RECORD_TRAFFIC, DEFAULT_RECORD_TRAFFIC))
+        self.consolidated_job_entities = bool(
+            entry.options.get(OPT_CONSOLIDATED_JOB_ENTITIES, DEFAULT_CONSOLIDATED_JOB_ENTITIES)
+        )
+        self.ws_filter_by_entity_groups = bool(
+            entry.options.get(OPT_WS_FILTER_BY_ENTITY_GROUPS, DEFAULT_WS_FILTER_BY_ENTITY_GROUPS)
+        )
+        self.recorder: BixTrafficRecorder | None = None
+        self.drift = BixDriftAuditor(
+            self.drift_poll_seconds,
+            DRIFT_MIN_SECONDS,
+            DRIFT_MAX_SECONDS,
+            DRIFT_LENGTHEN_FACTOR,
+            DRIFT_SHORTEN_FACTOR,
+            DRIFT_RATE_EWMA_ALPHA,
+            DRIFT_RATE_LOW,
+            DRIFT_RATE_HIGH,
+            DRIFT_RECENT_RECORDS,
+        )
+        self._drift_audit_request: tuple[int, int, int] | None = None
+        self._refresh_requests = 0
+        self._refresh_requests_served = 0
+        self._targeted_refreshes_in_flight = 0
+        self._ws_refresh_tasks: set[asyncio.Task[None]] = set()
+        self.stats: dict[str, int] = {
+            "refreshes": 0,
+            "refresh_failures": 0,
+            "ws_events": 0,
+            "ws_events_ignored": 0,
+            "targeted_refreshes": 0,
+            "entity_writes": 0,
+            "batched_updates": 0,
+            "coalesced_ws_events": 0,
+        }
+
+        self.shedding_level = SHED_LEVEL_NONE
+        self._unsub_write_batch: CALLBACK_TYPE | None = None
+        self._refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REQUEST_REFRESH_COOLDOWN_SECONDS,
+            immediate=True,
+        )
 
         super().__init__(
             hass,
             _LOGGER,
             name="BIX Backup",
-            update_interval=timedelta(seconds=self.poll_fallback_seconds),
+            update_interval=None,
+            request_refresh_debouncer=self._refresh_debouncer,
         )
 
+    @property
+    def poll_interval(self) -> float:
+        interval = float(self.drift.interval if self.ws_connected else self.poll_fallback_seconds)
+        if self.shedding_level >= SHED_LEVEL_SLOW_POLLS:
+            interval *= LOAD_SHED_POLL_MULTIPLIER
+        if self.ws_connected and self.ws_subscribe_capable and self.ws_filter_by_entity_groups:
+            interval = min(interval, float(self.drift_poll_seconds))
+        return interval
+
     @property
     def actions_capable(self) -> bool:
         capabilities = self.discovery.get("capabilities")
@@ -125,7 +537,73 @@ class BixBackupCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return False
         return bool(capabilities.get("actions_enabled"))
 
+    @property
+    def resource_state_capable(self) -> bool:
+        capabilities = self.discovery.get("capabilities")
+        if not isinstance(capabilities, dict):
+            return False
+        return bool(capabilities.get("resource_state"))
+
+    @property
+    def ws_subscribe_capable(self) -> bool:
+        capabilities = self.discovery.get("capabilities")
+        if not isinstance(capabilities, dict):
+            return False
+        return bool(capabilities.get("ws_subscribe"))
+
+    def _ws_event_types(self) -> list[str]:
+        if not self.ws_filter_by_entity_groups:
+            return ["config", *WS_EVENT_RECORD_TYPES]
+        events = ["config"]
+        if self.enable_host_entities:
+            events.append("host")
+        if self.enable_job_entities or (self.enable_action_buttons and self.actions_capable):
+            events.append("job")
+        if self.enable_alert_entities:
+            events.append("alerts")
+        return events
+
+    def _ws_record_types(self) -> list[str]:
+        if not self.ws_subscribe_capable:
+            return list(WS_EVENT_RECORD_TYPES.values())
+        return [WS_EVENT_RECORD_TYPES[event] for event in self._ws_event_types() if event in WS_EVENT_RECORD_TYPES]
+
+    def _build_ws_subscription(self) -> dict[str, Any] | None:
+        if not self.ws_subscribe_capable:
+            return None
+        events = self._ws_event_types()
+        subscription: dict[str, Any] = {"type": "subscribe", "events": events}
+        if self._index is None or not self.ws_filter_by_entity_groups:
+            return subscription
+        for event, key in (("job", "job_ids"), ("host", "host_ids")):
+            ids = self._index[WS_EVENT_RECORD_TYPES[event]]
+            if event in events and len(ids) <= WS_SUBSCRIBE_MAX_IDS:
+                subscription[key] = sorted(ids)
+        return subscription
+
+    @callback
+    def _async_sync_ws_subscription(self) -> None:
+        if self._ws_client is None:
+            return
+        subscription = self._build_ws_subscription()
+        if subscription != self._ws_client.subscription:
+            self.hass.async_create_task(self._ws_client.async_update_subscription(subscription))
+
+    def ws_diagnostics(self) -> dict[str, Any] | None:
+        if self._ws_client is None:
+            return None
+        return self._ws_client.diagnostics()
+
     async def async_initialize(self) -> None:
+        if self.record_traffic:
+            stamp = time.strftime("%Y%m%d_%H%M%S")
+            self.recorder = BixTrafficRecorder(
+                self.hass,
+                self.hass.config.path(f"bix_backup_traffic_{self.entry.entry_id}_{stamp}.jsonl.gz"),
+                str(self.entry.data[CONF_TOKEN]).strip(),
+            )
+            self.api.recorder = self.recorder
+            _LOGGER.warning("Recording BIX controller traffic to %s", self.recorder.path)
         self.discovery = await self.api.fetch_discovery()
         ws_url = str(self.discovery.get("transport", {}).get("ws_url", "")).strip()
         if ws_url:
@@ -135,42 +613,383 @@ class BixBackupCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 str(self.entry.data[CONF_TOKEN]).strip(),
                 self._handle_ws_event,
                 self._handle_ws_status,
+                self.recorder,
             )
+            await self._ws_client.async_update_subscription(self._build_ws_subscription())
             self._ws_client.start()
 
     async def async_shutdown(self) -> None:
+        await super().async_shutdown()
+        if self._unsub_write_batch is not None:
+            self._unsub_write_batch()
+            self._unsub_write_batch = None
         if self._ws_client is not None:
             await self._ws_client.stop()
             self._ws_client = None
+        if self.recorder is not None:
+            self.api.recorder = None
+            await self.recorder.async_close()
+            self.recorder = None
+        for task in self._ws_refresh_tasks:
+            task.cancel()
+        self._pending_bus_events.clear()
 
     async def _handle_ws_event(self, event_type: str, payload: dict[str, Any]) -> None:
+        session = self.profile_session
+        if session is None:
+            await self._async_process_ws_event(event_type, payload)
+            return
+        with session.measure(SECTION_WS_EVENT):
+            await self._async_process_ws_event(event_type, payload)
+
+    async def _async_process_ws_event(self, event_type: str, payload: dict[str, Any]) -> None:
         if event_type not in SUPPORTED_WS_EVENTS:
+            self.stats["ws_events_ignored"] += 1
             return
+        self.stats["ws_events"] += 1
         _LOGGER.debug("BIX WS event: %s", payload)
-        self.hass.async_create_task(self.async_request_refresh())
+        if self.shedding_level >= SHED_LEVEL_COALESCE_REFRESHES and event_type in ("job", "alerts"):
+            self.stats["coalesced_ws_events"] += 1
+        elif event_type == "job":
+            job_id = str(payload.get("job_id", "")).strip()
+            if job_id:
+                self._async_create_ws_refresh_task(self.async_refresh_job(job_id))
+                return
+        elif event_type == "alerts":
+            alert_id = str(payload.get("alert_id", payload.get("id", ""))).strip()
+            if alert_id:
+                self._async_create_ws_refresh_task(self.async_refresh_alert(alert_id))
+                return
+        self._async_create_ws_refresh_task(self.async_request_refresh())
+
+    @callback
+    def _async_create_ws_refresh_task(self, target: Coroutine[Any, Any, None]) -> None:
+        task = self.hass.async_create_task(target)
+        self._ws_refresh_tasks.add(task)
+        task.add_done_callback(self._ws_refresh_tasks.discard)
 
     async def _handle_ws_status(self, connected: bool) -> None:
         self.ws_connected = connected
-        next_interval = self.drift_poll_seconds if connected else self.poll_fallback_seconds
-        self.update_interval = timedelta(seconds=next_interval)
+        self.fleet.async_reschedule(self)
+
+    async def async_request_refresh(self) -> None:
+        self._refresh_requests += 1
+        await super().async_request_refresh()
+
+    def _refresh_activity(self) -> tuple[int, int, int]:
+        return self.stats["ws_events"], self.stats["targeted_refreshes"], self._refresh_requests
+
+    async def async_scheduled_refresh(self) -> None:
+        if self.ws_connected and self._index is not None:
+            if (
+                self._ws_refresh_tasks
+                or self._targeted_refreshes_in_flight
+                or self._refresh_requests > self._refresh_requests_served
+            ):
+                self.drift.record_skipped()
+            else:
+                self._drift_audit_request = self._refresh_activity()
+        try:
+            await self.async_refresh()
+        finally:
+            self._drift_audit_request = None
 
     async def _async_update_data(self) -> dict[str, Any]:
+        session = self.profile_session
+        if session is None:
+            return await self._async_fetch_state()
+        with session.measure(SECTION_UPDATE_DATA):
+            return await self._async_fetch_state()
+
+    async def _async_fetch_state(self) -> dict[str, Any]:
+        audit_request, self._drift_audit_request = self._drift_audit_request, None
+        refresh_requests = self._refresh_requests
+        self.stats["refreshes"] += 1
         try:
-            return await self.api.fetch_state()
+            payload, index = await self.api.fetch_state()
         except Exception as err:
+            self.stats["refresh_failures"] += 1
             raise UpdateFailed(str(err)) from err
+        self._refresh_requests_served = max(self._refresh_requests_served, refresh_requests)
+        session = self.profile_session
+        if session is None:
+            self._async_process_state(index, audit_request)
+        else:
+            with session.measure(SECTION_PROCESS_STATE):
+                self._async_process_state(index, audit_request)
+        return payload
+
+    @callback
+    def _async_process_state(self, index: StateIndex, audit_request: tuple[int, int, int] | None) -> None:
+        if audit_request is not None and self._index is not None:
+            self._audit_drift(self._index, index, audit_request)
+        if self._index is not None:
+            self._queue_transition_events(self._index, index)
+        self._index = index
+        self._async_sync_ws_subscription()
+
+    def _audit_drift(self, current: StateIndex, fetched: StateIndex, audit_request: tuple[int, int, int]) -> None:
+        if (
+            not self.ws_connected
+            or self._refresh_activity() != audit_request
+            or self.shedding_level >= SHED_LEVEL_SUSPEND_DIAGNOSTICS
+        ):
+            self.drift.record_skipped()
+            return
+        interval = self.drift.interval
+        divergent = self.drift.audit(current, fetched, self._ws_record_types())
+        if divergent:
+            _LOGGER.debug(
+                "BIX drift poll found %s records out of sync with WebSocket updates; drift interval %.0fs -> %.0fs",
+                divergent,
+                interval,
+                self.drift.interval,
+            )
+            self.fleet.async_reschedule(self)
+
+    async def async_refresh_job(self, job_id: str) -> None:
+        if not self.resource_state_capable or self.get_job(job_id) is None:
+            await self.async_request_refresh()
+            return
+        self._targeted_refreshes_in_flight += 1
+        try:
+            job = await self.api.fetch_job(job_id)
+        except Exception as err:
+            _LOGGER.debug("BIX job %s fetch failed, falling back to a full refresh: %s", job_id, err)
+            await self.async_request_refresh()
+            return
+        finally:
+            self._targeted_refreshes_in_flight -= 1
+        if job is None:
+            await self.async_request_refresh()
+            return
+        self._async_patch_job(job_id, job)
+
+    async def async_refresh_alert(self, alert_id: str) -> None:
+        if not self.resource_state_capable or self._index is None:
+            await self.async_request_refresh()
+            return
+        self._targeted_refreshes_in_flight += 1
+        try:
+            alert = await self.api.fetch_alert(alert_id)
+        except Exception as err:
+            _LOGGER.debug("BIX alert %s fetch failed, falling back to a full refresh: %s", alert_id, err)
+            await self.async_request_refresh()
+            return
+        finally:
+            self._targeted_refreshes_in_flight -= 1
+        self._async_patch_alert(alert_id, alert)
+
+    @callback
+    def _async_patch_job(self, job_id: str, job: dict[str, Any]) -> None:
+        if self._index is None or self.data is None:
+            return
+        existing = self._index["jobs"].get(job_id)
+        if existing is None:
+            return
+        previous = dict(existing)
+        existing.clear()
+        existing.update(job)
+        existing["job_id"] = job_id
+        existing.setdefault("open_alert_count", len(self._index["alerts_by_job"].get(job_id, {})))
+
+        summary = self.data.get("summary")
+        if isinstance(summary, dict) and isinstance(summary.get("running_jobs"), int):
+            summary["running_jobs"] += int(existing.get("running") is True) - int(previous.get("running") is True)
+
+        old = _empty_index()
+        new = _empty_index()
+        old["jobs"][job_id] = previous
+        new["jobs"][job_id] = existing
+        self._queue_transition_events(old, new)
+        self._async_publish_patch()
+
+    @callback
+    def _async_patch_alert(self, alert_id: str, alert: dict[str, Any] | None) -> None:
+        if self._index is None or self.data is None:
+            return
+        index = self._index
+        alerts = self.data.get("alerts")
+        if not isinstance(alerts, list):
+            alerts = self.data["alerts"] = []
+        existing = index["alerts"].get(alert_id)
+        if existing is None and alert is None:
+            return
+
+        old = _empty_index()
+        new = _empty_index()
+        job_ids: set[str] = set()
+        summary = self.data.get("summary")
+        if isinstance(summary, dict):
+            _adjust_alert_summary(summary, existing, -1)
+            _adjust_alert_summary(summary, alert, 1)
+        if existing is not None:
+            previous = dict(existing)
+            old["alerts"][alert_id] = previous
+            job_ids.add(str(previous.get("job_id", "")).strip())
+            _ungroup_alert(index, alert_id, existing)
+        if alert is None:
+            index["alerts"].pop(alert_id, None)
+            alerts.remove(existing)
+        else:
+            if existing is None:
+                existing = {}
+                alerts.append(existing)
+                index["alerts"][alert_id] = existing
+            existing.clear()
+            existing.update(alert)
+            existing["id"] = alert_id
+            new["alerts"][alert_id] = existing
+            job_ids.add(str(existing.get("job_id", "")).strip())
+            _group_alerts(index, alert_id, existing)
+
+        for job_id in job_ids:
+            job = index["jobs"].get(job_id)
+            if job is not None:
+                job["open_alert_count"] = len(index["alerts_by_job"].get(job_id, {}))
+
+        self._queue_transition_events(old, new)
+        self._async_publish_patch()
+
+    @callback
+    def _async_publish_patch(self) -> None:
+        self.stats["targeted_refreshes"] += 1
+        self.last_update_success = True
+        self.async_update_listeners()
+
+    @callback
+    def async_apply_load_shedding(self, level: int) -> None:
+        self.shedding_level = level
+        coalesce = level >= SHED_LEVEL_COALESCE_REFRESHES
+        self._refresh_debouncer.cooldown = (
+            LOAD_SHED_REFRESH_COOLDOWN_SECONDS if coalesce else REQUEST_REFRESH_COOLDOWN_SECONDS
+        )
+        self._refresh_debouncer.immediate = not coalesce
+        if level < SHED_LEVEL_BATCH_WRITES and self._unsub_write_batch is not None:
+            self._unsub_write_batch()
+            self._unsub_write_batch = None
+            self._async_flush_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        if self.shedding_level >= SHED_LEVEL_BATCH_WRITES:
+            self.stats["batched_updates"] += 1
+            if self._unsub_write_batch is None:
+                self._unsub_write_batch = async_call_later(
+                    self.hass, LOAD_SHED_WRITE_BATCH_SECONDS, self._async_write_batch_timer
+                )
+            return
+        self._async_flush_listeners()
+
+    @callback
+    def _async_write_batch_timer(self, _now: Any) -> None:
+        self._unsub_write_batch = None
+        self._async_flush_listeners()
+
+    @callback
+    def _async_flush_listeners(self) -> None:
+        session = self.profile_session
+        if session is None:
+            self._async_dispatch_update()
+            return
+        with session.measure(SECTION_DISPATCH):
+            self._async_dispatch_update()
+
+    @callback
+    def _async_dispatch_update(self) -> None:
+        self.stats["entity_writes"] += len(self._listeners)
+        super().async_update_listeners()
+        if not self._pending_bus_events:
+            return
+        events, self._pending_bus_events = self._pending_bus_events, []
+        for event_type, event_data in events:
+            self.hass.bus.async_fire(event_type, event_data)
+
+    def _queue_transition_events(self, old: StateIndex, new: StateIndex) -> None:
+        entry_id = self.entry.entry_id
+        queue = self._pending_bus_events
+
+        old_hosts = old["hosts"]
+        for host_id, host in new["hosts"].items():
+            prev = old_hosts.get(host_id)
+            if prev is None:
+                continue
+            was_connected = prev.get("connected")
+            connected = host.get("connected")
+            if was_connected is True and connected is False:
+                queue.append((EVENT_HOST_DISCONNECTED, {"entry_id": entry_id, "host_id": host_id}))
+            elif was_connected is False and connected is True:
+                queue.append((EVENT_HOST_CONNECTED, {"entry_id": entry_id, "host_id": host_id}))
+
+        old_jobs = old["jobs"]
+        for job_id, job in new["jobs"].items():
+            prev = old_jobs.get(job_id)
+            if prev is None:
+                continue
+            was_running = prev.get("running")
+            running = job.get("running")
+            if was_running is False and running is True:
+                queue.append(
+                    (
+                        EVENT_JOB_STARTED,
+                        {"entry_id": entry_id, "job_id": job_id, "host_id": job.get("host_id")},
+                    )
+                )
+            elif was_running is True and running is False:
+                queue.append(
+                    (
+                        EVENT_JOB_FINISHED,
+                        {
+                            "entry_id": entry_id,
+                            "job_id": job_id,
+                            "host_id": job.get("host_id"),
+                            "status": job.get("last_execution_status"),
+                            "duration_ms": job.get("last_duration_ms"),
+                            "finished_at": job.get("last_execution_time"),
+                        },
+                    )
+                )
+
+        old_alerts = {alert_id: alert for alert_id, alert in old["alerts"].items() if alert_is_open(alert)}
+        new_alerts = {alert_id: alert for alert_id, alert in new["alerts"].items() if alert_is_open(alert)}
+        for alert_id, alert in new_alerts.items():
+            if alert_id in old_alerts:
+                continue
+            queue.append(
+                (
+                    EVENT_ALERT_OPENED,
+                    {
+                        "entry_id": entry_id,
+                        "alert_id": alert_id,
+                        "job_id": alert.get("job_id"),
+                        "severity": alert.get("severity"),
+                        "message": alert.get("message"),
+                    },
+                )
+            )
+        for alert_id in old_alerts.keys() - new_alerts.keys():
+            alert = old_alerts[alert_id]
+            queue.append(
+                (
+                    EVENT_ALERT_CLOSED,
+                    {
+                        "entry_id": entry_id,
+                        "alert_id": alert_id,
+                        "job_id": alert.get("job_id"),
+                        "severity": alert.get("severity"),
+                    },
+                )
+            )
 
     def get_host(self, host_id: str) -> dict[str, Any] | None:
-        for host in self.data.get("hosts", []):
-            if host.get("id") == host_id:
-                return host
-        return None
+        if self._index is None:
+            return None
+        return self._index["hosts"].get(host_id)
 
     def get_job(self, job_id: str) -> dict[str, Any] | None:
-        for job in self.data.get("jobs", []):
-            if job.get("job_id") == job_id:
-                return job
-        return None
+        if self._index is None:
+            return None
+        return self._index["jobs"].get(job_id)
 
     def get_job_name(self, job_id: str) -> str:
         job = self.get_job(job_id)
@@ -208,17 +1027,48 @@ class BixBackupCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return name
 
     def get_alert(self, alert_id: str) -> dict[str, Any] | None:
-        for item in self.data.get("alerts", []):
-            if item.get("id") == alert_id:
-                return item
-        return None
+        if self._index is None:
+            return None
+        return self._index["alerts"].get(alert_id)
+
+    def get_alerts(
+        self,
+        severity: str | None = None,
+        job_id: str | None = None,
+        start: int = 0,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        if self._index is None:
+            return []
+        alerts: Iterable[dict[str, Any]]
+        if job_id is not None:
+            alerts = self._index["alerts_by_job"].get(job_id, {}).values()
+            if severity is not None:
+                alerts = (alert for alert in alerts if alert_severity(alert) == severity)
+        elif severity is not None:
+            alerts = self._index["alerts_by_severity"].get(severity, {}).values()
+        else:
+            alerts = self._index["open_alerts"].values()
+        stop = None if limit is None else start + limit
+        return list(islice(alerts, start, stop))
+
+    def count_alerts(self, severity: str | None = None, job_id: str | None = None) -> int:
+        if self._index is None:
+            return 0
+        if severity is not None and job_id is None:
+            return len(self._index["alerts_by_severity"].get(severity, {}))
+        if job_id is not None and severity is None:
+            return len(self._index["alerts_by_job"].get(job_id, {}))
+        if severity is None and job_id is None:
+            return len(self._index["open_alerts"])
+        return len(self.get_alerts(severity, job_id))
 
     async def async_run_backup(self, job_id: str) -> dict[str, Any]:
         if not self.actions_capable or not self.enable_action_buttons:
             raise HomeAssistantError("BIX actions are disabled")
         path = f"{ACTIONS_BASE_PATH}/jobs/{job_id}/run-backup"
         payload = await self.api.post_action(path)
-        await self.async_request_refresh()
+        await self.async_refresh_job(job_id)
         return payload
 
     async def async_ack_alert(self, alert_id: str) -> dict[str, Any]:
@@ -226,7 +1076,7 @@ class BixBackupCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise HomeAssistantError("BIX actions are disabled")
         path = f"{ACTIONS_BASE_PATH}/alerts/{alert_id}/ack"
         payload = await self.api.post_action(path)
-        await self.async_request_refresh()
+        await self.async_refresh_alert(alert_id)
         return payload
 
     async def async_resolve_alert(self, alert_id: str) -> dict[str, Any]:
@@ -234,5 +1084,5 @@ class BixBackupCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise HomeAssistantError("BIX actions are disabled")
         path = f"{ACTIONS_BASE_PATH}/alerts/{alert_id}/resolve"
         payload = await self.api.post_action(path)
-        await self.async_request_refresh()
+        await self.async_refresh_alert(alert_id)
         return payload
@@ -25,6 +25,12 @@ async def async_get_config_entry_diagnostics(
             TO_REDACT,
         ),
         "ws_connected": coordinator.ws_connected,
+        "ws": coordinator.ws_diagnostics(),
+        "api": coordinator.api.diagnostics(),
+        "fleet": coordinator.fleet.diagnostics(),
+        "drift": coordinator.drift.as_dict(),
+        "runtime": dict(coordinator.stats),
+        "traffic_recording": None if coordinator.recorder is None else coordinator.recorder.path,
         "discovery": coordinator.discovery,
         "state_summary": coordinator.data.get("summary", {}),
     }
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .coordinator import StateIndex
+
+DRIFT_RECORD_TYPES = ("hosts", "jobs", "alerts")
+DRIFT_IGNORED_FIELDS = frozenset({"last_seen"})
+
+KIND_STALE = "stale"
+KIND_MISSED = "missed"
+KIND_CHANGED = "changed"
+
+
+def _changed_fields(current: dict[str, Any], fetched: dict[str, Any]) -> list[str]:
+    if current == fetched:
+        return []
+    keys = (current.keys() | fetched.keys()) - DRIFT_IGNORED_FIELDS
+    return sorted(key for key in keys if current.get(key) != fetched.get(key))
+
+
+class BixDriftAuditor:
+    def __init__(
+        self,
+        interval_seconds: float,
+        min_seconds: float,
+        max_seconds: float,
+        lengthen_factor: float,
+        shorten_factor: float,
+        rate_alpha: float,
+        rate_low: float,
+        rate_high: float,
+        recent_records: int,
+    ) -> None:
+        self._configured_seconds = float(interval_seconds)
+        self._min_seconds = min_seconds
+        self._max_seconds = max(max_seconds, self._configured_seconds)
+        self._lengthen_factor = lengthen_factor
+        self._shorten_factor = shorten_factor
+        self._rate_alpha = rate_alpha
+        self._rate_low = rate_low
+        self._rate_high = rate_high
+        self._recent: deque[dict[str, Any]] = deque(maxlen=recent_records)
+        self._by_type: dict[str, dict[str, int]] = {
+            record_type: {
+                "divergent_audits": 0,
+                KIND_STALE: 0,
+                KIND_MISSED: 0,
+                KIND_CHANGED: 0,
+                "last_divergent_records": 0,
+            }
+            for record_type in DRIFT_RECORD_TYPES
+        }
+        self.interval = self._configured_seconds
+        self.audits = 0
+        self.divergent_audits = 0
+        self.skipped_audits = 0
+        self.divergence_rate = 0.0
+
+    def record_skipped(self) -> None:
+        self.skipped_audits += 1
+
+    def audit(self, current: StateIndex, fetched: StateIndex, record_types: Iterable[str]) -> int:
+        stamp = datetime.now(UTC).isoformat()
+        total = 0
+        for record_type in record_types:
+            old = current[record_type]
+            new = fetched[record_type]
+            divergent: list[tuple[str, str, list[str]]] = []
+            for rec_id in old.keys() - new.keys():
+                divergent.append((rec_id, KIND_STALE, []))
+            for rec_id, rec in new.items():
+                prev = old.get(rec_id)
+                if prev is None:
+                    divergent.append((rec_id, KIND_MISSED, []))
+                    continue
+                fields = _changed_fields(prev, rec)
+                if fields:
+                    divergent.append((rec_id, KIND_CHANGED, fields))
+
+            stats = self._by_type[record_type]
+            stats["last_divergent_records"] = len(divergent)
+            if divergent:
+                stats["divergent_audits"] += 1
+            for rec_id, kind, fields in divergent:
+                stats[kind] += 1
+                self._recent.append(
+                    {"at": stamp, "type": record_type, "id": rec_id, "kind": kind, "fields": fields}
+                )
+            total += len(divergent)
+
+        self.audits += 1
+        diverged = total > 0
+        if diverged:
+            self.divergent_audits += 1
+        self.divergence_rate += self._rate_alpha * (float(diverged) - self.divergence_rate)
+        if self.divergence_rate > self._rate_high:
+            self.interval = max(self._min_seconds, self.interval * self._shorten_factor)
+        elif self.divergence_rate < self._rate_low:
+            self.interval = min(self._max_seconds, self.interval * self._lengthen_factor)
+        return total
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "interval_seconds": round(self.interval, 1),
+            "configured_seconds": self._configured_seconds,
+            "min_seconds": self._min_seconds,
+            "max_seconds": self._max_seconds,
+            "audits": self.audits,
+            "divergent_audits": self.divergent_audits,
+            "skipped_audits": self.skipped_audits,
+            "divergence_rate_ewma": round(self.divergence_rate, 3),
+            "divergence_rate_low": self._rate_low,
+            "divergence_rate_high": self._rate_high,
+            "by_type": {record_type: dict(stats) for record_type, stats in self._by_type.items()},
+            "recent_divergent_records": list(self._recent),
+        }
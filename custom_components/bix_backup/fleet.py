@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import LOAD_SHED_ENTER_MS, LOAD_SHED_EXIT_RATIO
+from .load_shedding import SHED_LEVEL_SUSPEND_DIAGNOSTICS, BixLoadShedder
+from .loop_lag import BixLoopLagMonitor
+
+if TYPE_CHECKING:
+    from .coordinator import BixBackupCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BixFleetScheduler:
+    def __init__(self, hass: HomeAssistant, max_concurrent_fetches: int) -> None:
+        self._hass = hass
+        self._fetch_semaphore = asyncio.Semaphore(max_concurrent_fetches)
+        self._max_concurrent_fetches = max_concurrent_fetches
+        self._members: dict[str, BixBackupCoordinator] = {}
+        self._member_unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._next_due: dict[str, float] = {}
+        self._polling: set[str] = set()
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._waiting_fetches = 0
+        self._shedding_listeners: list[CALLBACK_TYPE] = []
+        self._summary_suspended = False
+        self.summary_owner: str | None = None
+        self.loop_lag = BixLoopLagMonitor(hass, self._async_loop_lag_sampled)
+        self.shedding = BixLoadShedder(LOAD_SHED_ENTER_MS, LOAD_SHED_EXIT_RATIO)
+
+    @asynccontextmanager
+    async def fetch_slot(self) -> AsyncIterator[None]:
+        self._waiting_fetches += 1
+        try:
+            await self._fetch_semaphore.acquire()
+        finally:
+            self._waiting_fetches -= 1
+        try:
+            yield
+        finally:
+            self._fetch_semaphore.release()
+
+    @callback
+    def async_add(self, coordinator: BixBackupCoordinator) -> None:
+        entry_id = coordinator.entry.entry_id
+        self._members[entry_id] = coordinator
+        self._member_unsubs[entry_id] = coordinator.async_add_listener(self._async_member_updated)
+        coordinator.async_apply_load_shedding(self.shedding.level)
+        self.loop_lag.async_start()
+        self._async_restagger()
+        self._async_notify_listeners()
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        self._members.pop(entry_id, None)
+        self._next_due.pop(entry_id, None)
+        unsub = self._member_unsubs.pop(entry_id, None)
+        if unsub is not None:
+            unsub()
+        if not self._members:
+            self.loop_lag.async_stop()
+        self._async_restagger()
+        self._async_notify_listeners()
+
+    @callback
+    def async_claim_summary(self, entry_id: str) -> bool:
+        if self.summary_owner not in (None, entry_id):
+            return False
+        self.summary_owner = entry_id
+        return True
+
+    @callback
+    def async_release_summary(self, entry_id: str) -> None:
+        if self.summary_owner != entry_id:
+            return
+        self.summary_owner = None
+        self._async_hand_off_summary()
+
+    @callback
+    def _async_hand_off_summary(self) -> None:
+        for entry_id in sorted(self._members):
+            if self._members[entry_id].enable_fleet_sensors:
+                _LOGGER.debug("Reloading BIX entry %s to take over the fleet summary sensors", entry_id)
+                self._hass.config_entries.async_schedule_reload(entry_id)
+                return
+
+    @callback
+    def async_reschedule(self, coordinator: BixBackupCoordinator) -> None:
+        entry_id = coordinator.entry.entry_id
+        if entry_id not in self._members:
+            return
+        current = self._next_due.get(entry_id)
+        due = self._hass.loop.time() + coordinator.poll_interval
+        if current is None or due < current:
+            self._next_due[entry_id] = due
+            self._async_arm_timer()
+
+    @callback
+    def _async_restagger(self) -> None:
+        now = self._hass.loop.time()
+        count = len(self._members)
+        for slot, entry_id in enumerate(sorted(self._members), start=1):
+            interval = self._members[entry_id].poll_interval
+            self._next_due[entry_id] = now + interval * slot / count
+        self._async_arm_timer()
+
+    @callback
+    def _async_arm_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if not self._next_due:
+            return
+        delay = max(0.0, min(self._next_due.values()) - self._hass.loop.time())
+        self._unsub_timer = async_call_later(self._hass, delay, self._async_timer_fired)
+
+    @callback
+    def _async_timer_fired(self, _now: Any) -> None:
+        self._unsub_timer = None
+        now = self._hass.loop.time()
+        for entry_id, due in list(self._next_due.items()):
+            if due > now:
+                continue
+            coordinator = self._members[entry_id]
+            interval = coordinator.poll_interval
+            while due <= now:
+                due += interval
+            self._next_due[entry_id] = due
+            if entry_id in self._polling:
+                _LOGGER.debug("Skipping BIX poll for %s: previous poll still running", entry_id)
+                continue
+            self._hass.async_create_background_task(
+                self._async_poll(entry_id, coordinator),
+                f"bix_backup_poll {entry_id}",
+            )
+        self._async_arm_timer()
+
+    async def _async_poll(self, entry_id: str, coordinator: BixBackupCoordinator) -> None:
+        self._polling.add(entry_id)
+        try:
+            await coordinator.async_scheduled_refresh()
+        finally:
+            self._polling.discard(entry_id)
+
+    @callback
+    def _async_loop_lag_sampled(self) -> None:
+        previous = self.shedding.level
+        if not self.shedding.update(self.loop_lag.ewma_ms):
+            return
+        level = self.shedding.level
+        log = _LOGGER.warning if level > previous else _LOGGER.info
+        log(
+            "BIX load shedding level %s -> %s (%s), event loop lag EWMA %.0f ms",
+            previous,
+            level,
+            self.shedding.level_name,
+            self.loop_lag.ewma_ms,
+        )
+        for coordinator in list(self._members.values()):
+            coordinator.async_apply_load_shedding(level)
+            self.async_reschedule(coordinator)
+        if level < SHED_LEVEL_SUSPEND_DIAGNOSTICS and self._summary_suspended:
+            self._summary_suspended = False
+            self._async_notify_listeners()
+        for update_callback in list(self._shedding_listeners):
+            update_callback()
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def async_add_shedding_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        self._shedding_listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._shedding_listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def _async_member_updated(self) -> None:
+        if self.shedding.level >= SHED_LEVEL_SUSPEND_DIAGNOSTICS:
+            self._summary_suspended = True
+            return
+        self._async_notify_listeners()
+
+    @callback
+    def _async_notify_listeners(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def summary_total(self, key: str) -> int | None:
+        total: int | None = None
+        for coordinator in self._members.values():
+            data = coordinator.data
+            if not isinstance(data, dict):
+                continue
+            summary = data.get("summary")
+            if not isinstance(summary, dict):
+                continue
+            value = summary.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                total = (total or 0) + int(value)
+        return total
+
+    def controllers_online(self) -> int:
+        return sum(1 for coordinator in self._members.values() if coordinator.last_update_success)
+
+    def diagnostics(self) -> dict[str, Any]:
+        now = self._hass.loop.time()
+        return {
+            "members": sorted(self._members),
+            "max_concurrent_fetches": self._max_concurrent_fetches,
+            "waiting_fetches": self._waiting_fetches,
+            "polling": sorted(self._polling),
+            "loop_lag": self.loop_lag.as_dict(),
+            "load_shedding": self.shedding.as_dict(),
+            "next_poll_in_seconds": {
+                entry_id: round(due - now, 1) for entry_id, due in sorted(self._next_due.items())
+            },
+        }
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_ws(text: str, pos: int) -> int:
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _expect(text: str, pos: int, allowed: str) -> tuple[str, int]:
+    char = text[pos : pos + 1]
+    if not char or char not in allowed:
+        raise ValueError(f"Expected one of {allowed!r} at offset {pos}")
+    return char, _skip_ws(text, pos + 1)
+
+
+def _check_end(text: str, pos: int) -> None:
+    if pos != len(text):
+        raise ValueError(f"Extra data at offset {pos}")
+
+
+def _load_array(text: str, pos: int) -> tuple[list[Any], int]:
+    items: list[Any] = []
+    _, pos = _expect(text, pos, "[")
+    if text[pos : pos + 1] == "]":
+        _, pos = _expect(text, pos, "]")
+        return items, pos
+    while True:
+        item, pos = _DECODER.raw_decode(text, pos)
+        items.append(item)
+        sep, pos = _expect(text, _skip_ws(text, pos), ",]")
+        if sep == "]":
+            return items, pos
+
+
+def loads_incremental(text: str) -> Any:
+    pos = _skip_ws(text, 0)
+    if text[pos : pos + 1] != "{":
+        return _DECODER.decode(text)
+    result: dict[str, Any] = {}
+    _, pos = _expect(text, pos, "{")
+    if text[pos : pos + 1] == "}":
+        _, pos = _expect(text, pos, "}")
+        _check_end(text, pos)
+        return result
+    while True:
+        if text[pos : pos + 1] != '"':
+            raise ValueError(f"Expected object key at offset {pos}")
+        key, pos = _DECODER.raw_decode(text, pos)
+        _, pos = _expect(text, _skip_ws(text, pos), ":")
+        if text[pos : pos + 1] == "[":
+            value, pos = _load_array(text, pos)
+        else:
+            value, pos = _DECODER.raw_decode(text, pos)
+        result[key] = value
+        sep, pos = _expect(text, _skip_ws(text, pos), ",}")
+        if sep == "}":
+            _check_end(text, pos)
+            return result
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+SHED_LEVEL_NONE = 0
+SHED_LEVEL_COALESCE_REFRESHES = 1
+SHED_LEVEL_BATCH_WRITES = 2
+SHED_LEVEL_SUSPEND_DIAGNOSTICS = 3
+SHED_LEVEL_SLOW_POLLS = 4
+
+SHED_LEVEL_NAMES = (
+    "normal",
+    "coalesce_refreshes",
+    "batch_entity_writes",
+    "suspend_diagnostics",
+    "slow_polls",
+)
+
+
+class BixLoadShedder:
+    def __init__(self, enter_ms: tuple[float, ...], exit_ratio: float) -> None:
+        self._enter_ms = enter_ms
+        self._exit_ratio = exit_ratio
+        self._changed_at: float | None = None
+        self.level = SHED_LEVEL_NONE
+        self.transitions = 0
+        self.max_level = SHED_LEVEL_NONE
+
+    @property
+    def level_name(self) -> str:
+        return SHED_LEVEL_NAMES[self.level]
+
+    def update(self, lag_ms: float) -> bool:
+        level = self.level
+        target = sum(1 for threshold in self._enter_ms if lag_ms >= threshold)
+        if target > level:
+            level = target
+        else:
+            while level > SHED_LEVEL_NONE and lag_ms < self._enter_ms[level - 1] * self._exit_ratio:
+                level -= 1
+        if level == self.level:
+            return False
+        self.level = level
+        self.max_level = max(self.max_level, level)
+        self.transitions += 1
+        self._changed_at = time.monotonic()
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "level": self.level,
+            "level_name": self.level_name,
+            "max_level": self.max_level,
+            "transitions": self.transitions,
+            "seconds_in_level": (
+                None if self._changed_at is None else round(time.monotonic() - self._changed_at, 1)
+            ),
+            "enter_ms": list(self._enter_ms),
+            "exit_ratio": self._exit_ratio,
+        }
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+LOOP_LAG_SAMPLE_SECONDS = 1.0
+LOOP_LAG_EWMA_ALPHA = 0.2
+STALL_SAMPLE_SECONDS = 0.005
+
+
+def current_rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            pages = int(handle.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class BixLoopLagMonitor:
+    def __init__(self, hass: HomeAssistant, on_sample: Callable[[], None] | None = None) -> None:
+        self._hass = hass
+        self._on_sample = on_sample
+        self._handle: asyncio.TimerHandle | None = None
+        self._expected = 0.0
+        self.last_ms = 0.0
+        self.ewma_ms = 0.0
+        self.max_ms = 0.0
+        self.samples = 0
+
+    @callback
+    def async_start(self) -> None:
+        if self._handle is None:
+            self._schedule()
+
+    @callback
+    def async_stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(self) -> None:
+        loop = self._hass.loop
+        self._expected = loop.time() + LOOP_LAG_SAMPLE_SECONDS
+        self._handle = loop.call_at(self._expected, self._sample)
+
+    def _sample(self) -> None:
+        lag_ms = max(0.0, (self._hass.loop.time() - self._expected) * 1000)
+        self.last_ms = lag_ms
+        self.max_ms = max(self.max_ms, lag_ms)
+        if self.samples == 0:
+            self.ewma_ms = lag_ms
+        else:
+            self.ewma_ms += LOOP_LAG_EWMA_ALPHA * (lag_ms - self.ewma_ms)
+        self.samples += 1
+        self._schedule()
+        if self._on_sample is not None:
+            self._on_sample()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "last_ms": round(self.last_ms, 1),
+            "ewma_ms": round(self.ewma_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+            "samples": self.samples,
+        }
+
+
+class BixLoopStallSampler:
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._handle: asyncio.TimerHandle | None = None
+        self._expected = 0.0
+        self.max_stall_ms = 0.0
+        self.samples = 0
+        self.rss_start: int | None = None
+        self.rss_peak: int | None = None
+        self.rss_end: int | None = None
+
+    def start(self) -> None:
+        self.rss_start = self.rss_peak = current_rss_bytes()
+        self._schedule()
+
+    def stop(self) -> None:
+        if self._handle is None:
+            return
+        self._handle.cancel()
+        self._handle = None
+        self._record(self._loop.time())
+        self.rss_end = self._sample_rss()
+
+    def _schedule(self) -> None:
+        self._expected = self._loop.time() + STALL_SAMPLE_SECONDS
+        self._handle = self._loop.call_at(self._expected, self._sample)
+
+    def _record(self, now: float) -> None:
+        self.max_stall_ms = max(self.max_stall_ms, (now - self._expected) * 1000)
+        self.samples += 1
+
+    def _sample_rss(self) -> int | None:
+        rss = current_rss_bytes()
+        if rss is not None and self.rss_peak is not None:
+            self.rss_peak = max(self.rss_peak, rss)
+        return rss
+
+    def _sample(self) -> None:
+        self._record(self._loop.time())
+        self._sample_rss()
+        self._schedule()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import cProfile
+import io
+import logging
+import pstats
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+SECTION_UPDATE_DATA = "update_data"
+SECTION_WS_EVENT = "ws_event"
+SECTION_DISPATCH = "dispatch"
+SECTION_PROCESS_STATE = "process_state"
+
+PROFILED_SECTIONS = frozenset({SECTION_WS_EVENT, SECTION_DISPATCH, SECTION_PROCESS_STATE})
+COUNTED_SECTIONS = frozenset({SECTION_UPDATE_DATA, SECTION_WS_EVENT})
+
+SUMMARY_TOP_FUNCTIONS = 40
+
+
+class BixProfileSession:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        duration: float,
+        max_calls: int,
+        on_finished: Callable[[BixProfileSession], None],
+    ) -> None:
+        self._hass = hass
+        self._duration = duration
+        self._max_calls = max_calls
+        self._on_finished = on_finished
+        self._profile = cProfile.Profile()
+        self._depth = 0
+        self._calls = 0
+        self._started = time.time()
+        self._finished = False
+        self._error: str | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._timings: dict[str, list[float]] = {
+            SECTION_UPDATE_DATA: [],
+            SECTION_WS_EVENT: [],
+            SECTION_DISPATCH: [],
+            SECTION_PROCESS_STATE: [],
+        }
+
+    @callback
+    def async_start(self) -> None:
+        self._unsub_timer = async_call_later(self._hass, self._duration, self._async_timer_expired)
+
+    @callback
+    def _async_timer_expired(self, _now: Any) -> None:
+        self._unsub_timer = None
+        self._hass.async_create_task(self.async_finish())
+
+    @contextmanager
+    def measure(self, section: str) -> Iterator[None]:
+        if self._finished or self._error is not None:
+            yield
+            return
+        profiled = section in PROFILED_SECTIONS and self._enter_profile()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._timings[section].append(time.perf_counter() - started)
+            if profiled:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._profile.disable()
+            if section in COUNTED_SECTIONS:
+                self._calls += 1
+                if self._calls == self._max_calls:
+                    self._hass.async_create_task(self.async_finish())
+
+    def _enter_profile(self) -> bool:
+        if self._error is not None:
+            return False
+        if self._depth == 0:
+            try:
+                self._profile.enable()
+            except ValueError as err:
+                self._error = str(err)
+                _LOGGER.error("BIX profile stopped: the profiler could not be enabled (%s)", err)
+                self._hass.async_create_task(self.async_finish())
+                return False
+        self._depth += 1
+        return True
+
+    async def async_finish(self) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._depth:
+            self._profile.disable()
+            self._depth = 0
+        self._on_finished(self)
+
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(self._started))
+        profile_path = self._hass.config.path(f"bix_backup_profile_{stamp}.prof")
+        summary_path = self._hass.config.path(f"bix_backup_profile_{stamp}.txt")
+        await self._hass.async_add_executor_job(self._write, profile_path, summary_path)
+        _LOGGER.warning("BIX profile written to %s (summary: %s)", profile_path, summary_path)
+
+    def _write(self, profile_path: str, summary_path: str) -> None:
+        self._profile.dump_stats(profile_path)
+        out = io.StringIO()
+        out.write(f"BIX Backup profile started {time.ctime(self._started)}\n")
+        out.write(f"Profiled calls: {self._calls} (limit {self._max_calls}, {self._duration:.0f}s)\n")
+        out.write(
+            "Function statistics cover the synchronous sections only "
+            f"({', '.join(sorted(PROFILED_SECTIONS))}); {SECTION_UPDATE_DATA} is wall time including the HTTP wait.\n"
+        )
+        if self._error is not None:
+            out.write(f"Profiling stopped early: {self._error}\n")
+        out.write("\n")
+        for section, samples in self._timings.items():
+            if not samples:
+                out.write(f"{section}: no samples\n")
+                continue
+            total_ms = sum(samples) * 1000
+            out.write(
+                f"{section}: count={len(samples)} total={total_ms:.1f}ms "
+                f"avg={total_ms / len(samples):.2f}ms max={max(samples) * 1000:.2f}ms\n"
+            )
+        out.write("\n")
+        try:
+            stats = pstats.Stats(self._profile, stream=out)
+        except TypeError:
+            out.write("No profile data collected.\n")
+        else:
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(SUMMARY_TOP_FUNCTIONS)
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(SUMMARY_TOP_FUNCTIONS)
+        with open(summary_path, "w", encoding="utf-8") as handle:
+            handle.write(out.getvalue())
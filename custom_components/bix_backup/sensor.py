@@ -4,12 +4,15 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import ALERT_FEED_FIELDS, ALERT_FEED_PAGE_SIZE, ALERT_SEVERITIES, DATA_FLEET, DOMAIN
 from .coordinator import BixBackupCoordinator
+from .fleet import BixFleetScheduler
 
 
 SUMMARY_SENSORS = (
@@ -22,6 +25,31 @@ SUMMARY_SENSORS = (
     ("open_alerts_info", "Open Info Alerts"),
 )
 
+JOB_SENSORS = (
+    ("last_execution_status", "Last Execution Status"),
+    ("last_execution_time", "Last Execution Time"),
+    ("last_success_time", "Last Success Time"),
+    ("last_failure_time", "Last Failure Time"),
+    ("last_duration_ms", "Last Duration (ms)"),
+    ("last_backup_total_files", "Last Backup Total Files"),
+    ("last_backup_total_bytes", "Last Backup Total Bytes"),
+    ("last_backup_data_added_bytes", "Last Backup Data Added"),
+    ("open_alert_count", "Open Alert Count"),
+)
+
+JOB_STATUS_ATTRIBUTES = (
+    "enabled",
+    "running",
+    "last_execution_time",
+    "last_success_time",
+    "last_failure_time",
+    "last_duration_ms",
+    "last_backup_total_files",
+    "last_backup_total_bytes",
+    "last_backup_data_added_bytes",
+    "open_alert_count",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,34 +59,57 @@ async def async_setup_entry(
     coordinator: BixBackupCoordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[SensorEntity] = [BixSummarySensor(coordinator, key, label) for key, label in SUMMARY_SENSORS]
 
+    fleet: BixFleetScheduler = hass.data[DATA_FLEET]
+    entities.append(BixLoadSheddingSensor(fleet, entry.entry_id))
+    if coordinator.enable_fleet_sensors and fleet.async_claim_summary(entry.entry_id):
+        fleet_entities = [
+            BixFleetControllersOnlineSensor(fleet),
+            *(BixFleetSummarySensor(fleet, key, label) for key, label in SUMMARY_SENSORS),
+        ]
+        _async_drop_disabled_fleet_sensors(hass, entry.entry_id, fleet_entities)
+        entities.extend(fleet_entities)
+
     if coordinator.enable_host_entities:
         for host in coordinator.data.get("hosts", []):
             host_id = str(host.get("id", "")).strip()
             if host_id:
                 entities.append(BixHostLastSeenSensor(coordinator, host_id))
 
+    if coordinator.enable_alert_entities:
+        entities.extend(BixAlertFeedSensor(coordinator, severity=severity) for severity in ALERT_SEVERITIES)
+        for job in coordinator.data.get("jobs", []):
+            job_id = str(job.get("job_id", "")).strip()
+            if job_id:
+                entities.append(BixAlertFeedSensor(coordinator, job_id=job_id))
+
     if coordinator.enable_job_entities:
         for job in coordinator.data.get("jobs", []):
             job_id = str(job.get("job_id", "")).strip()
             if not job_id:
                 continue
-            entities.extend(
-                [
-                    BixJobSensor(coordinator, job_id, "last_execution_status", "Last Execution Status"),
-                    BixJobSensor(coordinator, job_id, "last_execution_time", "Last Execution Time"),
-                    BixJobSensor(coordinator, job_id, "last_success_time", "Last Success Time"),
-                    BixJobSensor(coordinator, job_id, "last_failure_time", "Last Failure Time"),
-                    BixJobSensor(coordinator, job_id, "last_duration_ms", "Last Duration (ms)"),
-                    BixJobSensor(coordinator, job_id, "last_backup_total_files", "Last Backup Total Files"),
-                    BixJobSensor(coordinator, job_id, "last_backup_total_bytes", "Last Backup Total Bytes"),
-                    BixJobSensor(coordinator, job_id, "last_backup_data_added_bytes", "Last Backup Data Added"),
-                    BixJobSensor(coordinator, job_id, "open_alert_count", "Open Alert Count"),
-                ]
-            )
+            if coordinator.consolidated_job_entities:
+                entities.append(BixJobStatusSensor(coordinator, job_id))
+            entities.extend(BixJobSensor(coordinator, job_id, key, label) for key, label in JOB_SENSORS)
 
     async_add_entities(entities)
 
 
+@callback
+def _async_drop_disabled_fleet_sensors(
+    hass: HomeAssistant, entry_id: str, fleet_entities: list[BixFleetSummarySensor]
+) -> None:
+    registry = er.async_get(hass)
+    for entity in fleet_entities:
+        entity_id = registry.async_get_entity_id(Platform.SENSOR, DOMAIN, str(entity.unique_id))
+        reg_entry = registry.async_get(entity_id) if entity_id is not None else None
+        if (
+            reg_entry is not None
+            and reg_entry.config_entry_id != entry_id
+            and reg_entry.disabled_by is er.RegistryEntryDisabler.CONFIG_ENTRY
+        ):
+            registry.async_remove(reg_entry.entity_id)
+
+
 class BixSummarySensor(CoordinatorEntity[BixBackupCoordinator], SensorEntity):
     def __init__(self, coordinator: BixBackupCoordinator, key: str, label: str) -> None:
         super().__init__(coordinator)
@@ -74,6 +125,101 @@ class BixSummarySensor(CoordinatorEntity[BixBackupCoordinator], SensorEntity):
         return None
 
 
+class BixFleetSummarySensor(SensorEntity):
+    _attr_should_poll = False
+
+    def __init__(self, fleet: BixFleetScheduler, key: str, label: str) -> None:
+        self._fleet = fleet
+        self._key = key
+        self._attr_name = f"BIX Fleet {label}"
+        self._attr_unique_id = f"bix_fleet_{key}"
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(self._fleet.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> Any:
+        return self._fleet.summary_total(self._key)
+
+
+class BixFleetControllersOnlineSensor(BixFleetSummarySensor):
+    def __init__(self, fleet: BixFleetScheduler) -> None:
+        super().__init__(fleet, "controllers_online", "Controllers Online")
+
+    @property
+    def native_value(self) -> Any:
+        return self._fleet.controllers_online()
+
+
+class BixLoadSheddingSensor(SensorEntity):
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, fleet: BixFleetScheduler, entry_id: str) -> None:
+        self._fleet = fleet
+        self._attr_name = "BIX Load Shedding Level"
+        self._attr_unique_id = f"bix_{entry_id}_load_shedding"
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(self._fleet.async_add_shedding_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> int:
+        return self._fleet.shedding.level
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return {
+            "level_name": self._fleet.shedding.level_name,
+            "max_level": self._fleet.shedding.max_level,
+            "transitions": self._fleet.shedding.transitions,
+        }
+
+
+class BixAlertFeedSensor(CoordinatorEntity[BixBackupCoordinator], SensorEntity):
+    _unrecorded_attributes = frozenset({"alerts", "page_size", "truncated"})
+
+    def __init__(
+        self,
+        coordinator: BixBackupCoordinator,
+        severity: str | None = None,
+        job_id: str | None = None,
+    ) -> None:
+        super().__init__(coordinator)
+        self._severity = severity
+        self._job_id = job_id
+        if job_id is not None:
+            self._attr_unique_id = f"bix_job_{job_id}_alerts"
+        else:
+            self._attr_unique_id = f"bix_alerts_{severity}"
+        self._attr_name = self._build_name()
+
+    def _build_name(self) -> str:
+        if self._job_id is not None:
+            return f"BIX Job {self.coordinator.get_job_label(self._job_id)} Alerts"
+        return f"BIX {str(self._severity).title()} Alerts"
+
+    @property
+    def name(self) -> str | None:
+        return self._build_name()
+
+    @property
+    def native_value(self) -> int:
+        return self.coordinator.count_alerts(self._severity, self._job_id)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        alerts = self.coordinator.get_alerts(self._severity, self._job_id, limit=ALERT_FEED_PAGE_SIZE + 1)
+        return {
+            "alerts": [
+                {field: alert[field] for field in ALERT_FEED_FIELDS if field in alert}
+                for alert in alerts[:ALERT_FEED_PAGE_SIZE]
+            ],
+            "page_size": ALERT_FEED_PAGE_SIZE,
+            "truncated": len(alerts) > ALERT_FEED_PAGE_SIZE,
+        }
+
+
 class BixHostLastSeenSensor(CoordinatorEntity[BixBackupCoordinator], SensorEntity):
     def __init__(self, coordinator: BixBackupCoordinator, host_id: str) -> None:
         super().__init__(coordinator)
@@ -101,6 +247,7 @@ class BixJobSensor(CoordinatorEntity[BixBackupCoordinator], SensorEntity):
         self._label = label
         self._attr_name = f"BIX Job {coordinator.get_job_label(job_id)} {label}"
         self._attr_unique_id = f"bix_job_{job_id}_{key}"
+        self._attr_entity_registry_enabled_default = not coordinator.consolidated_job_entities
         if key in {"last_backup_total_bytes", "last_backup_data_added_bytes"}:
             self._attr_native_unit_of_measurement = "B"
 
@@ -118,3 +265,39 @@ class BixJobSensor(CoordinatorEntity[BixBackupCoordinator], SensorEntity):
     @property
     def available(self) -> bool:
         return super().available and self.coordinator.get_job(self._job_id) is not None
+
+
+class BixJobStatusSensor(CoordinatorEntity[BixBackupCoordinator], SensorEntity):
+    _unrecorded_attributes = frozenset({"job_id", "host_id", *JOB_STATUS_ATTRIBUTES})
+
+    def __init__(self, coordinator: BixBackupCoordinator, job_id: str) -> None:
+        super().__init__(coordinator)
+        self._job_id = job_id
+        self._attr_name = f"BIX Job {coordinator.get_job_label(job_id)} Status"
+        self._attr_unique_id = f"bix_job_{job_id}_status"
+
+    @property
+    def name(self) -> str | None:
+        return f"BIX Job {self.coordinator.get_job_label(self._job_id)} Status"
+
+    @property
+    def native_value(self) -> Any:
+        job = self.coordinator.get_job(self._job_id)
+        if job is None:
+            return None
+        return job.get("last_execution_status")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        job = self.coordinator.get_job(self._job_id)
+        if job is None:
+            return {}
+        return {
+            "job_id": self._job_id,
+            "host_id": job.get("host_id"),
+            **{key: job.get(key) for key in JOB_STATUS_ATTRIBUTES},
+        }
+
+    @property
+    def available(self) -> bool:
+        return super().available and self.coordinator.get_job(self._job_id) is not None
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ALERT_FEED_FIELDS,
+    ALERT_FEED_PAGE_SIZE,
+    ALERT_SERVICE_MAX_PAGE_SIZE,
+    ALERT_SEVERITIES,
+    DEFAULT_PROFILE_DURATION_SECONDS,
+    DEFAULT_PROFILE_MAX_CALLS,
+    DOMAIN,
+    EVENT_ACTION_FAILED,
+    EVENT_ACTION_SUCCEEDED,
+    SERVICE_ACK_ALERT,
+    SERVICE_GET_ALERTS,
+    SERVICE_PROFILE,
+    SERVICE_RESOLVE_ALERT,
+    SERVICE_RUN_BACKUP,
+)
+from .coordinator import BixBackupCoordinator
+from .profiler import BixProfileSession
+
+RUN_BACKUP_SCHEMA = vol.Schema(
+    {
+        vol.Required("job_id"): cv.string,
+        vol.Optional("entry_id"): cv.string,
+    }
+)
+
+ALERT_ACTION_SCHEMA = vol.Schema(
+    {
+        vol.Required("alert_id"): cv.string,
+        vol.Optional("entry_id"): cv.string,
+    }
+)
+
+GET_ALERTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entry_id"): cv.string,
+        vol.Optional("severity"): vol.In(ALERT_SEVERITIES),
+        vol.Optional("job_id"): cv.string,
+        vol.Optional("page", default=1): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("page_size", default=ALERT_FEED_PAGE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=ALERT_SERVICE_MAX_PAGE_SIZE)
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("duration", default=DEFAULT_PROFILE_DURATION_SECONDS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=3600)
+        ),
+        vol.Optional("max_calls", default=DEFAULT_PROFILE_MAX_CALLS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10000)
+        ),
+        vol.Optional("entry_id"): cv.string,
+    }
+)
+
+
+def _coordinators(hass: HomeAssistant, entry_id: str | None = None) -> list[BixBackupCoordinator]:
+    coordinators: dict[str, BixBackupCoordinator] = hass.data.get(DOMAIN, {})
+    if entry_id is None:
+        return list(coordinators.values())
+    coordinator = coordinators.get(entry_id)
+    if coordinator is None:
+        raise HomeAssistantError(f"BIX Backup entry {entry_id} is not loaded")
+    return [coordinator]
+
+
+def _find_coordinator(
+    hass: HomeAssistant,
+    entry_id: str | None,
+    lookup: Callable[[BixBackupCoordinator], Any],
+    label: str,
+) -> BixBackupCoordinator:
+    coordinators = _coordinators(hass, entry_id)
+    for coordinator in coordinators:
+        if lookup(coordinator) is not None:
+            return coordinator
+    if len(coordinators) == 1:
+        return coordinators[0]
+    raise HomeAssistantError(f"Unknown BIX Backup {label}")
+
+
+async def _async_run_action(
+    hass: HomeAssistant,
+    action: str,
+    target: dict[str, str],
+    runner: Callable[[], Awaitable[dict[str, Any]]],
+) -> None:
+    try:
+        await runner()
+    except Exception as err:
+        hass.bus.async_fire(EVENT_ACTION_FAILED, {"action": action, **target, "error": str(err)})
+        raise HomeAssistantError(str(err)) from err
+    hass.bus.async_fire(EVENT_ACTION_SUCCEEDED, {"action": action, **target})
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    async def _async_run_backup(call: ServiceCall) -> None:
+        job_id = call.data["job_id"]
+        coordinator = _find_coordinator(hass, call.data.get("entry_id"), lambda c: c.get_job(job_id), "job")
+        await _async_run_action(
+            hass, "run_backup", {"job_id": job_id}, lambda: coordinator.async_run_backup(job_id)
+        )
+
+    async def _async_ack_alert(call: ServiceCall) -> None:
+        alert_id = call.data["alert_id"]
+        coordinator = _find_coordinator(hass, call.data.get("entry_id"), lambda c: c.get_alert(alert_id), "alert")
+        await _async_run_action(
+            hass, "ack", {"alert_id": alert_id}, lambda: coordinator.async_ack_alert(alert_id)
+        )
+
+    async def _async_resolve_alert(call: ServiceCall) -> None:
+        alert_id = call.data["alert_id"]
+        coordinator = _find_coordinator(hass, call.data.get("entry_id"), lambda c: c.get_alert(alert_id), "alert")
+        await _async_run_action(
+            hass, "resolve", {"alert_id": alert_id}, lambda: coordinator.async_resolve_alert(alert_id)
+        )
+
+    async def _async_get_alerts(call: ServiceCall) -> ServiceResponse:
+        severity = call.data.get("severity")
+        job_id = call.data.get("job_id")
+        page = call.data["page"]
+        page_size = call.data["page_size"]
+        start = (page - 1) * page_size
+        total = 0
+        alerts: list[dict[str, Any]] = []
+        for coordinator in _coordinators(hass, call.data.get("entry_id")):
+            count = coordinator.count_alerts(severity, job_id)
+            if len(alerts) < page_size and start < total + count:
+                offset = max(0, start - total)
+                for alert in coordinator.get_alerts(severity, job_id, offset, page_size - len(alerts)):
+                    item = {field: alert[field] for field in ALERT_FEED_FIELDS if field in alert}
+                    item["entry_id"] = coordinator.entry.entry_id
+                    alerts.append(item)
+            total += count
+        return {
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "alerts": alerts,
+        }
+
+    async def _async_profile(call: ServiceCall) -> None:
+        coordinators = _coordinators(hass, call.data.get("entry_id"))
+        if not coordinators:
+            raise HomeAssistantError("No BIX Backup entries are loaded")
+        if any(coordinator.profile_session is not None for coordinator in coordinators):
+            raise HomeAssistantError("A BIX Backup profile is already running")
+
+        @callback
+        def _detach(session: BixProfileSession) -> None:
+            for coordinator in coordinators:
+                if coordinator.profile_session is session:
+                    coordinator.profile_session = None
+
+        session = BixProfileSession(hass, call.data["duration"], call.data["max_calls"], _detach)
+        for coordinator in coordinators:
+            coordinator.profile_session = session
+        session.async_start()
+
+    hass.services.async_register(DOMAIN, SERVICE_RUN_BACKUP, _async_run_backup, schema=RUN_BACKUP_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_ACK_ALERT, _async_ack_alert, schema=ALERT_ACTION_SCHEMA)
+    hass.services.async_register(DOMAIN, SERVICE_RESOLVE_ALERT, _async_resolve_alert, schema=ALERT_ACTION_SCHEMA)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_ALERTS,
+        _async_get_alerts,
+        schema=GET_ALERTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE, _async_profile, schema=PROFILE_SCHEMA)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+import gzip
+import json
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORD_KIND_WS = "ws"
+RECORD_KIND_HTTP = "http"
+
+TRAFFIC_FLUSH_SECONDS = 5.0
+TRAFFIC_FLUSH_RECORDS = 500
+REDACTED = "**REDACTED**"
+
+
+class BixTrafficRecorder:
+    def __init__(self, hass: HomeAssistant, path: str, token: str) -> None:
+        self._hass = hass
+        self._path = path
+        self._token = token
+        self._started = time.monotonic()
+        self._buffer: list[dict[str, Any]] = []
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._closed = False
+        self._write_lock = asyncio.Lock()
+        self.records = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @callback
+    def record_ws(self, frame: str) -> None:
+        self._append({"kind": RECORD_KIND_WS, "data": frame})
+
+    @callback
+    def record_http(self, path: str, status: int, body: bytes) -> None:
+        self._append({"kind": RECORD_KIND_HTTP, "path": path, "status": status, "body": body})
+
+    @callback
+    def _append(self, record: dict[str, Any]) -> None:
+        if self._closed:
+            return
+        record["t"] = round(time.monotonic() - self._started, 4)
+        record["ts"] = datetime.now(UTC).isoformat()
+        self._buffer.append(record)
+        self.records += 1
+        if len(self._buffer) >= TRAFFIC_FLUSH_RECORDS:
+            self._async_schedule_flush(0)
+        elif self._unsub_flush is None:
+            self._async_schedule_flush(TRAFFIC_FLUSH_SECONDS)
+
+    @callback
+    def _async_schedule_flush(self, delay: float) -> None:
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+        self._unsub_flush = async_call_later(self._hass, delay, self._async_flush_timer)
+
+    @callback
+    def _async_flush_timer(self, _now: Any) -> None:
+        self._unsub_flush = None
+        self._hass.async_create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        if not self._buffer:
+            return
+        records, self._buffer = self._buffer, []
+        async with self._write_lock:
+            await self._hass.async_add_executor_job(self._write, records)
+
+    async def async_close(self) -> None:
+        self._closed = True
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        await self.async_flush()
+        _LOGGER.info("BIX traffic recording closed: %s (%s records)", self._path, self.records)
+
+    def _write(self, records: list[dict[str, Any]]) -> None:
+        with gzip.open(self._path, "at", encoding="utf-8") as handle:
+            for record in records:
+                body = record.get("body")
+                if isinstance(body, bytes):
+                    record = {**record, "body": body.decode("utf-8", errors="replace")}
+                line = json.dumps(record, separators=(",", ":"), default=str)
+                if self._token:
+                    line = line.replace(self._token, REDACTED)
+                handle.write(line)
+                handle.write("\n")
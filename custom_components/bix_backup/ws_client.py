@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+from collections import Counter
 from collections.abc import Awaitable, Callable
 import json
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
+if TYPE_CHECKING:
+    from .traffic import BixTrafficRecorder
+
 _LOGGER = logging.getLogger(__name__)
 
 EventCallback = Callable[[str, dict[str, Any]], Awaitable[None]]
@@ -22,15 +27,60 @@ class BixWsClient:
         token: str,
         event_callback: EventCallback,
         status_callback: StatusCallback,
+        recorder: BixTrafficRecorder | None = None,
     ) -> None:
         self._session = session
         self._ws_url = ws_url
         self._token = token
         self._event_callback = event_callback
         self._status_callback = status_callback
+        self._recorder = recorder
         self._stop_event = asyncio.Event()
         self._task: asyncio.Task[None] | None = None
         self._socket: aiohttp.ClientWebSocketResponse | None = None
+        self._subscription: dict[str, Any] | None = None
+        self._connected_at: float | None = None
+        self._connection_messages = 0
+        self.messages = 0
+        self.message_types: Counter[str] = Counter()
+        self.subscriptions_sent = 0
+
+    @property
+    def subscription(self) -> dict[str, Any] | None:
+        return self._subscription
+
+    async def async_update_subscription(self, subscription: dict[str, Any] | None) -> None:
+        if subscription == self._subscription:
+            return
+        self._subscription = subscription
+        if self._socket is not None and not self._socket.closed:
+            await self._send_subscription(self._socket)
+
+    async def _send_subscription(self, socket: aiohttp.ClientWebSocketResponse) -> None:
+        if self._subscription is None:
+            return
+        try:
+            await socket.send_json(self._subscription)
+        except (aiohttp.ClientError, ConnectionError) as err:
+            _LOGGER.debug("BIX websocket subscription not sent: %s", err)
+            return
+        self.subscriptions_sent += 1
+        _LOGGER.debug("BIX websocket subscription sent: %s", self._subscription)
+
+    def diagnostics(self) -> dict[str, Any]:
+        rate = None
+        if self._connected_at is not None:
+            elapsed = time.monotonic() - self._connected_at
+            rate = round(self._connection_messages / elapsed, 3) if elapsed > 0 else None
+        return {
+            "connected": self._socket is not None,
+            "messages": self.messages,
+            "messages_this_connection": self._connection_messages,
+            "messages_per_second": rate,
+            "message_types": dict(self.message_types),
+            "subscription": self._subscription,
+            "subscriptions_sent": self.subscriptions_sent,
+        }
 
     def start(self) -> None:
         if self._task is None:
@@ -56,6 +106,9 @@ class BixWsClient:
                     receive_timeout=90,
                 ) as socket:
                     self._socket = socket
+                    self._connected_at = time.monotonic()
+                    self._connection_messages = 0
+                    await self._send_subscription(socket)
                     await self._status_callback(True)
                     backoff = 1
                     async for msg in socket:
@@ -63,16 +116,22 @@ class BixWsClient:
                             break
                         if msg.type != aiohttp.WSMsgType.TEXT:
                             continue
+                        self.messages += 1
+                        self._connection_messages += 1
+                        if self._recorder is not None:
+                            self._recorder.record_ws(msg.data)
                         payload = json.loads(msg.data)
                         if not isinstance(payload, dict):
                             continue
                         event_type = payload.get("type")
                         if isinstance(event_type, str):
+                            self.message_types[event_type] += 1
                             await self._event_callback(event_type, payload)
             except (aiohttp.ClientError, TimeoutError, json.JSONDecodeError) as err:
                 _LOGGER.debug("BIX websocket disconnected: %s", err)
             finally:
                 self._socket = None
+                self._connected_at = None
                 await self._status_callback(False)
 
             if self._stop_event.is_set():
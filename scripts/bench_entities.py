@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.core import HomeAssistant  # noqa: I001
+from homeassistant import bootstrap, loader
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+DOMAIN = "bix_backup"
+API_BASE = "/api/integrations/home-assistant"
+DISCOVERY_PATH = f"{API_BASE}/discovery"
+STATE_PATH = f"{API_BASE}/state"
+PLATFORM_DOMAINS = ("sensor", "binary_sensor", "button")
+SEVERITIES = ("critical", "warning", "info")
+DEFAULT_COMPONENT_DIR = Path(__file__).resolve().parent.parent / "custom_components" / DOMAIN
+
+
+def build_state(hosts: int, jobs: int, alerts: int) -> dict[str, Any]:
+    return {
+        "schema_version": 1,
+        "summary": {
+            "connected_hosts": hosts,
+            "running_jobs": 0,
+            "jobs_failed_24h": 0,
+            "open_alerts_total": alerts,
+            **{
+                f"open_alerts_{severity}": len(range(index, alerts, len(SEVERITIES)))
+                for index, severity in enumerate(SEVERITIES)
+            },
+        },
+        "hosts": [
+            {"id": f"host-{i}", "connected": True, "running": False, "last_seen": "2026-01-01T00:00:00Z"}
+            for i in range(hosts)
+        ],
+        "jobs": [
+            {
+                "job_id": f"job-{i}",
+                "job_name": f"Job {i}",
+                "host_id": f"host-{i % max(hosts, 1)}",
+                "enabled": True,
+                "running": False,
+                "can_run_backup": True,
+                "last_execution_status": "success",
+                "last_execution_time": "2026-01-01T00:00:00Z",
+                "last_success_time": "2026-01-01T00:00:00Z",
+                "last_failure_time": None,
+                "last_duration_ms": 1000 + i,
+                "last_backup_total_files": 10_000 + i,
+                "last_backup_total_bytes": 1_000_000 + i,
+                "last_backup_data_added_bytes": 1000 + i,
+                "open_alert_count": len(range(i, alerts, max(jobs, 1))),
+            }
+            for i in range(jobs)
+        ],
+        "alerts": [
+            {
+                "id": f"alert-{i}",
+                "job_id": f"job-{i % max(jobs, 1)}",
+                "severity": SEVERITIES[i % len(SEVERITIES)],
+                "status": "open",
+                "title": f"Alert {i}",
+                "message": "Backup failed: repository locked",
+                "created_at": "2026-01-01T00:00:00Z",
+                "can_ack": True,
+                "can_resolve": True,
+            }
+            for i in range(alerts)
+        ],
+    }
+
+
+async def async_start_controller(state: dict[str, Any]) -> tuple[web.AppRunner, str]:
+    async def _handle_get(request: web.Request) -> web.Response:
+        if request.path == DISCOVERY_PATH:
+            return web.json_response({"schema_version": 1, "capabilities": {"actions_enabled": True}, "transport": {}})
+        if request.path == STATE_PATH:
+            return web.json_response(state)
+        return web.json_response({"error": "not found"}, status=404)
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", _handle_get)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def async_start_hass(config_dir: str, component_dir: Path) -> HomeAssistant:
+    custom_components = Path(config_dir) / "custom_components"
+    custom_components.mkdir()
+    (custom_components / DOMAIN).symlink_to(component_dir.resolve())
+    sys.path.insert(0, config_dir)
+    hass = HomeAssistant(config_dir)
+    loader.async_setup(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    for domain in PLATFORM_DOMAINS:
+        await async_setup_component(hass, domain, {})
+    await hass.async_start()
+    return hass
+
+
+def rss_mib() -> float:
+    with open("/proc/self/statm", encoding="ascii") as handle:
+        pages = int(handle.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1_048_576
+
+
+def registry_counts(hass: HomeAssistant, entry_id: str) -> dict[str, int]:
+    entries = er.async_entries_for_config_entry(er.async_get(hass), entry_id)
+    states = [state for entry in entries if (state := hass.states.get(entry.entity_id)) is not None]
+    return {
+        "registry_entries": len(entries),
+        "registry_enabled": sum(1 for entry in entries if entry.disabled_by is None),
+        "registry_disabled": sum(1 for entry in entries if entry.disabled_by is not None),
+        "legacy_alert_buttons": sum(1 for entry in entries if entry.unique_id.startswith("bix_alert_")),
+        "states": sum(1 for state in states if not state.attributes.get("restored")),
+        "restored_placeholders": sum(1 for state in states if state.attributes.get("restored")),
+    }
+
+
+async def async_measure(hass: HomeAssistant, label: str, action: Any, entry_id: str, trace: bool) -> None:
+    gc.collect()
+    rss_before = rss_mib()
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    await action()
+    await hass.async_block_till_done()
+    elapsed = time.perf_counter() - started
+    traced = ""
+    if trace:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        traced = f", traced {current / 1_048_576:.1f} MiB (peak {peak / 1_048_576:.1f} MiB)"
+    gc.collect()
+    counts = registry_counts(hass, entry_id)
+    print(f"  {label}:")
+    print(f"    wall time:             {elapsed * 1000:.0f} ms")
+    print(f"    RSS delta:             {rss_mib() - rss_before:+.1f} MiB{traced}")
+    for key, value in counts.items():
+        print(f"    {key + ':':22} {value}")
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    state = build_state(args.hosts, args.jobs, args.alerts)
+    runner, url = await async_start_controller(state)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir, Path(args.component_dir))
+        entry = ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title="BIX Backup bench",
+            data={"base_url": url, "token": "bench"},
+            source="user",
+            options=dict(args.option),
+        )
+        if args.seed_legacy_alert_buttons:
+            registry = er.async_get(hass)
+            hass.config_entries._entries[entry.entry_id] = entry  # noqa: SLF001
+            for i in range(args.alerts):
+                for action in ("ack", "resolve"):
+                    registry.async_get_or_create(
+                        "button", DOMAIN, f"bix_alert_alert-{i}_{action}", config_entry=entry
+                    )
+            del hass.config_entries._entries[entry.entry_id]  # noqa: SLF001
+
+        print(
+            f"hosts={args.hosts} jobs={args.jobs} alerts={args.alerts} options={dict(args.option)} "
+            f"component={args.component_dir}"
+        )
+        await async_measure(
+            hass, "setup", lambda: hass.config_entries.async_add(entry), entry.entry_id, args.tracemalloc
+        )
+        if args.reload_option:
+            options = {**entry.options, **dict(args.reload_option)}
+
+            async def _async_update_options() -> None:
+                hass.config_entries.async_update_entry(entry, options=options)
+
+            await async_measure(
+                hass, f"reload with {dict(args.reload_option)}", _async_update_options, entry.entry_id, False
+            )
+            await async_measure(
+                hass,
+                "reload again (steady state)",
+                lambda: hass.config_entries.async_reload(entry.entry_id),
+                entry.entry_id,
+                args.tracemalloc,
+            )
+        await hass.async_stop(force=True)
+    await runner.cleanup()
+
+
+def _option(raw: str) -> tuple[str, Any]:
+    key, _, value = raw.partition("=")
+    lowered = value.strip().lower()
+    if lowered in {"true", "false"}:
+        return key.strip(), lowered == "true"
+    if lowered.isdigit():
+        return key.strip(), int(lowered)
+    return key.strip(), value.strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Set up a bix_backup config entry on a Home Assistant core against an in-process stand-in "
+            "controller with a synthetic state, and report setup time, RSS growth, entity registry entries "
+            "and states. Requires a Home Assistant installation (Linux, reads /proc/self/statm)."
+        )
+    )
+    parser.add_argument("--hosts", type=int, default=50)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--alerts", type=int, default=5000)
+    parser.add_argument("--option", action="append", type=_option, default=[], help="entry option key=value")
+    parser.add_argument(
+        "--reload-option",
+        action="append",
+        type=_option,
+        default=[],
+        help="after setup, change this option (key=value) and measure the reload",
+    )
+    parser.add_argument(
+        "--seed-legacy-alert-buttons",
+        action="store_true",
+        help="pre-register per-alert ack/resolve buttons as left behind by older versions",
+    )
+    parser.add_argument("--component-dir", default=str(DEFAULT_COMPONENT_DIR), help="bix_backup checkout to load")
+    parser.add_argument("--tracemalloc", action="store_true", help="also report traced Python allocations (slower)")
+    asyncio.run(async_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
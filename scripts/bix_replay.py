@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+from bisect import bisect_right
+from collections import Counter
+import gzip
+import json
+import time
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+DISCOVERY_PATH = "/api/integrations/home-assistant/discovery"
+WS_PATH = "/ws/ui"
+
+
+def load_recording(path: str) -> tuple[list[tuple[float, str]], dict[str, list[tuple[float, int, Any]]]]:
+    frames: list[tuple[float, str]] = []
+    responses: dict[str, list[tuple[float, int, Any]]] = {}
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("kind") == "ws":
+                frames.append((float(record["t"]), str(record["data"])))
+            elif record.get("kind") == "http":
+                body = record.get("body")
+                payload = json.loads(body) if isinstance(body, str) else record.get("data")
+                responses.setdefault(str(record["path"]), []).append(
+                    (float(record["t"]), int(record.get("status", 200)), payload)
+                )
+    frames.sort(key=lambda item: item[0])
+    for items in responses.values():
+        items.sort(key=lambda item: item[0])
+    return frames, responses
+
+
+class BixReplayController:
+    def __init__(
+        self,
+        frames: list[tuple[float, str]],
+        responses: dict[str, list[tuple[float, int, Any]]],
+        speed: float,
+        public_url: str,
+        ws_subscribe: bool,
+    ) -> None:
+        self._frames = frames
+        self._responses = responses
+        self._response_times = {path: [item[0] for item in items] for path, items in responses.items()}
+        self._speed = speed
+        self._public_url = public_url
+        self._ws_subscribe = ws_subscribe
+        self._clients: set[web.WebSocketResponse] = set()
+        self._subscriptions: dict[web.WebSocketResponse, dict[str, Any]] = {}
+        self._first_client = asyncio.Event()
+        self._started: float | None = None
+        self.get_counts: Counter[str] = Counter()
+        self.post_counts: Counter[str] = Counter()
+        self.frames_sent = 0
+        self.frames_filtered = 0
+        self.subscriptions_received = 0
+        self.ws_connections = 0
+
+    def recording_time(self) -> float:
+        if self._started is None:
+            return 0.0
+        return (time.monotonic() - self._started) * self._speed
+
+    async def wait_for_client(self) -> None:
+        await self._first_client.wait()
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get(WS_PATH, self._handle_ws)
+        app.router.add_get("/{tail:.*}", self._handle_get)
+        app.router.add_post("/{tail:.*}", self._handle_post)
+        return app
+
+    async def _handle_get(self, request: web.Request) -> web.Response:
+        path = request.path
+        self.get_counts[path] += 1
+        items = self._responses.get(path)
+        if not items:
+            return web.json_response({"error": "not recorded"}, status=404)
+        pos = bisect_right(self._response_times[path], self.recording_time())
+        _, status, payload = items[max(0, pos - 1)]
+        if path == DISCOVERY_PATH and isinstance(payload, dict):
+            payload = dict(payload)
+            transport = dict(payload.get("transport") or {})
+            transport["ws_url"] = self._public_url.replace("http", "ws", 1) + WS_PATH
+            payload["transport"] = transport
+            if self._ws_subscribe:
+                payload["capabilities"] = {**(payload.get("capabilities") or {}), "ws_subscribe": True}
+        return web.json_response(payload, status=status)
+
+    async def _handle_post(self, request: web.Request) -> web.Response:
+        self.post_counts[request.path] += 1
+        return web.json_response({"ok": True, "replay": True})
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        socket = web.WebSocketResponse(heartbeat=30)
+        await socket.prepare(request)
+        self.ws_connections += 1
+        self._clients.add(socket)
+        self._first_client.set()
+        try:
+            async for msg in socket:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                try:
+                    message = json.loads(msg.data)
+                except ValueError:
+                    continue
+                if isinstance(message, dict) and message.get("type") == "subscribe":
+                    self.subscriptions_received += 1
+                    self._subscriptions[socket] = message
+        finally:
+            self._clients.discard(socket)
+            self._subscriptions.pop(socket, None)
+        return socket
+
+    @staticmethod
+    def _wanted(subscription: dict[str, Any] | None, payload: Any) -> bool:
+        if subscription is None or not isinstance(payload, dict):
+            return True
+        event_type = payload.get("type")
+        if event_type not in subscription.get("events", []):
+            return False
+        if event_type == "job" and "job_ids" in subscription:
+            job_id = payload.get("job_id")
+            return job_id is None or job_id in subscription["job_ids"]
+        if event_type == "host" and "host_ids" in subscription:
+            host_id = payload.get("host_id", payload.get("id"))
+            return host_id is None or host_id in subscription["host_ids"]
+        return True
+
+    async def run(self, wait_for_client: bool, tail_seconds: float) -> float:
+        if wait_for_client:
+            print("Waiting for the integration to connect to the stand-in controller...")
+            await self.wait_for_client()
+        self._started = time.monotonic()
+        for frame_time, frame in self._frames:
+            delay = frame_time / self._speed - (time.monotonic() - self._started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            payload: Any = None
+            if self._subscriptions:
+                try:
+                    payload = json.loads(frame)
+                except ValueError:
+                    payload = None
+            for socket in list(self._clients):
+                if not self._wanted(self._subscriptions.get(socket), payload):
+                    self.frames_filtered += 1
+                    continue
+                try:
+                    await socket.send_str(frame)
+                except ConnectionError:
+                    self._clients.discard(socket)
+                    continue
+                self.frames_sent += 1
+        await asyncio.sleep(tail_seconds)
+        return time.monotonic() - self._started
+
+
+async def fetch_diagnostics(
+    session: aiohttp.ClientSession, ha_url: str, ha_token: str, entry_id: str
+) -> dict[str, Any]:
+    url = f"{ha_url.rstrip('/')}/api/diagnostics/config_entry/{entry_id}"
+    async with session.get(url, headers={"Authorization": f"Bearer {ha_token}"}) as resp:
+        resp.raise_for_status()
+        payload = await resp.json()
+    return payload.get("data", payload)
+
+
+def print_report(
+    controller: BixReplayController,
+    elapsed: float,
+    before: dict[str, Any] | None,
+    after: dict[str, Any] | None,
+) -> None:
+    print()
+    print("BIX replay report")
+    print(f"  wall time:           {elapsed:.1f}s")
+    print(f"  ws connections:      {controller.ws_connections}")
+    print(f"  ws frames sent:      {controller.frames_sent} ({controller.frames_sent / max(elapsed, 0.001):.1f}/s)")
+    print(f"  ws frames filtered:  {controller.frames_filtered}")
+    print(f"  ws subscriptions:    {controller.subscriptions_received}")
+    for path, count in sorted(controller.get_counts.items()):
+        print(f"  GET  {path}: {count}")
+    for path, count in sorted(controller.post_counts.items()):
+        print(f"  POST {path}: {count}")
+    if before is None or after is None:
+        return
+    runtime_before = before.get("runtime", {})
+    runtime_after = after.get("runtime", {})
+    print("  Home Assistant side:")
+    for key in sorted(runtime_after):
+        delta = runtime_after.get(key, 0) - runtime_before.get(key, 0)
+        print(f"    {key}: {delta} ({delta / max(elapsed, 0.001):.2f}/s)")
+    ws_before = before.get("ws") or {}
+    ws_after = after.get("ws") or {}
+    if ws_after:
+        messages = ws_after.get("messages", 0) - ws_before.get("messages", 0)
+        print(f"    ws messages received: {messages} ({messages / max(elapsed, 0.001):.2f}/s)")
+    loop_lag = after.get("fleet", {}).get("loop_lag", {})
+    if loop_lag:
+        print(
+            "    event loop lag: "
+            f"last={loop_lag.get('last_ms')}ms ewma={loop_lag.get('ewma_ms')}ms max={loop_lag.get('max_ms')}ms"
+        )
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    frames, responses = load_recording(args.recording)
+    public_url = args.public_url or f"http://{args.host}:{args.port}"
+    controller = BixReplayController(frames, responses, args.speed, public_url, args.ws_subscribe)
+    runner = web.AppRunner(controller.build_app())
+    await runner.setup()
+    await web.TCPSite(runner, args.host, args.port).start()
+    print(
+        f"Stand-in controller on {public_url}: {len(frames)} ws frames, "
+        f"{sum(len(items) for items in responses.values())} http responses, speed {args.speed}x"
+    )
+
+    report_ha = bool(args.ha_url and args.ha_token and args.entry_id)
+    async with aiohttp.ClientSession() as session:
+        try:
+            if report_ha:
+                await controller.wait_for_client()
+            before = (
+                await fetch_diagnostics(session, args.ha_url, args.ha_token, args.entry_id) if report_ha else None
+            )
+            elapsed = await controller.run(not args.no_wait, args.tail)
+            after = (
+                await fetch_diagnostics(session, args.ha_url, args.ha_token, args.entry_id) if report_ha else None
+            )
+        finally:
+            await runner.cleanup()
+    print_report(controller, elapsed, before, after)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Replay a BIX Backup traffic recording (bix_backup_traffic_*.jsonl.gz) through a local "
+            "stand-in controller. Point a Home Assistant config entry at the printed URL. WebSocket "
+            "frames are replayed on their recorded schedule divided by --speed; HTTP GETs return the "
+            "recorded response that was current at that point of the recording."
+        )
+    )
+    parser.add_argument("recording")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--public-url", help="URL Home Assistant uses to reach this stand-in controller")
+    parser.add_argument("--tail", type=float, default=10.0, help="seconds to keep serving after the last frame")
+    parser.add_argument(
+        "--ws-subscribe",
+        action="store_true",
+        help="advertise capabilities.ws_subscribe and honour subscribe messages when sending frames",
+    )
+    parser.add_argument("--no-wait", action="store_true", help="start replaying without waiting for a WS client")
+    parser.add_argument("--ha-url", help="Home Assistant URL for before/after diagnostics")
+    parser.add_argument("--ha-token", help="Home Assistant long-lived access token")
+    parser.add_argument("--entry-id", help="config entry id of the BIX Backup entry under test")
+    args = parser.parse_args()
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+    asyncio.run(async_main(args))
+
+
+if __name__ == "__main__":
+    main()
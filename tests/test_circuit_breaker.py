@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from conftest import load_module
+
+cb = load_module("circuit_breaker")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(cb.time, "monotonic", fake)
+    return fake
+
+
+def _breaker() -> Any:
+    return cb.BixCircuitBreaker(failure_threshold=3, slow_call_seconds=5.0, open_seconds=10.0, max_open_seconds=40.0)
+
+
+def test_trips_after_threshold_failures(clock: FakeClock) -> None:
+    breaker = _breaker()
+    for _ in range(2):
+        assert breaker.allow_request()
+        breaker.record_failure("boom")
+    assert breaker.state == cb.STATE_CLOSED
+    assert breaker.allow_request()
+    breaker.record_failure("boom")
+    assert breaker.state == cb.STATE_OPEN
+    assert not breaker.allow_request()
+    assert breaker.as_dict()["rejected_requests"] == 1
+
+
+def test_success_resets_failure_count(clock: FakeClock) -> None:
+    breaker = _breaker()
+    breaker.record_failure("boom")
+    breaker.record_failure("boom")
+    breaker.record_success(0.1)
+    breaker.record_failure("boom")
+    assert breaker.state == cb.STATE_CLOSED
+
+
+def test_half_open_allows_single_probe(clock: FakeClock) -> None:
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure("boom")
+    clock.now += 10.0
+    assert breaker.state == cb.STATE_HALF_OPEN
+    assert breaker.allow_request()
+    assert breaker.probe_in_flight
+    assert not breaker.allow_request()
+    breaker.record_success(0.1)
+    assert breaker.state == cb.STATE_CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_probe_doubles_open_time_up_to_max(clock: FakeClock) -> None:
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure("boom")
+    for expected in (20.0, 40.0, 40.0):
+        clock.now += breaker.as_dict()["open_seconds"]
+        assert breaker.allow_request()
+        breaker.record_failure("still down")
+        assert breaker.state == cb.STATE_OPEN
+        assert breaker.as_dict()["open_seconds"] == expected
+    clock.now += 39.0
+    assert not breaker.allow_request()
+
+
+def test_successful_probe_restores_base_open_time(clock: FakeClock) -> None:
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure("boom")
+    clock.now += 10.0
+    assert breaker.allow_request()
+    breaker.record_failure("still down")
+    clock.now += 20.0
+    assert breaker.allow_request()
+    breaker.record_success(0.1)
+    assert breaker.as_dict()["open_seconds"] == 10.0
+
+
+def test_slow_call_counts_as_failure(clock: FakeClock) -> None:
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_success(6.0)
+    assert breaker.state == cb.STATE_OPEN
+    assert breaker.as_dict()["last_failure"] == "slow response (6.0s)"
+
+
+def test_released_probe_does_not_block_later_requests(clock: FakeClock) -> None:
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure("boom")
+    clock.now += 10.0
+    assert breaker.allow_request()
+    breaker.release_probe()
+    assert not breaker.probe_in_flight
+    assert breaker.allow_request()
+
+
+def test_retry_budget_limits_retries() -> None:
+    budget = cb.BixRetryBudget(max_tokens=2.0, deposit_per_request=0.5, initial_tokens=1.0)
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_withdraw()
+    for _ in range(10):
+        budget.record_request()
+    assert budget.as_dict()["tokens"] == 2.0
+    assert budget.as_dict() == {"tokens": 2.0, "retries": 2, "exhausted": 1}
+
+
+def test_backoff_with_jitter_is_capped() -> None:
+    for attempt in range(10):
+        delay = cb.backoff_with_jitter(attempt, 0.5, 5.0)
+        assert 0 <= delay <= min(5.0, 0.5 * 2**attempt)
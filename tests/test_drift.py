@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from conftest import load_module
+
+drift = load_module("drift")
+
+
+def _auditor(interval: float = 300.0) -> Any:
+    return drift.BixDriftAuditor(
+        interval,
+        min_seconds=30.0,
+        max_seconds=3600.0,
+        lengthen_factor=1.5,
+        shorten_factor=0.5,
+        rate_alpha=0.2,
+        rate_low=0.1,
+        rate_high=0.3,
+        recent_records=3,
+    )
+
+
+def _index(
+    hosts: dict[str, dict[str, Any]] | None = None,
+    jobs: dict[str, dict[str, Any]] | None = None,
+    alerts: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    return {"hosts": hosts or {}, "jobs": jobs or {}, "alerts": alerts or {}}
+
+
+def test_matching_state_lengthens_interval() -> None:
+    auditor = _auditor()
+    jobs = {"job-1": {"job_id": "job-1", "running": False}}
+    assert auditor.audit(_index(jobs=jobs), _index(jobs={"job-1": dict(jobs["job-1"])}), drift.DRIFT_RECORD_TYPES) == 0
+    assert auditor.interval == 450.0
+    assert auditor.divergence_rate == 0.0
+    assert auditor.as_dict()["recent_divergent_records"] == []
+
+
+def test_classifies_stale_missed_and_changed_records() -> None:
+    auditor = _auditor()
+    current = _index(
+        jobs={"job-1": {"running": False}, "job-2": {"running": False}},
+        alerts={"alert-1": {"severity": "info"}},
+    )
+    fetched = _index(
+        jobs={"job-1": {"running": True}, "job-3": {"running": False}},
+        alerts={"alert-1": {"severity": "info"}},
+    )
+    assert auditor.audit(current, fetched, drift.DRIFT_RECORD_TYPES) == 3
+
+    jobs = auditor.as_dict()["by_type"]["jobs"]
+    assert (jobs[drift.KIND_STALE], jobs[drift.KIND_MISSED], jobs[drift.KIND_CHANGED]) == (1, 1, 1)
+    assert jobs["divergent_audits"] == 1
+    assert auditor.as_dict()["by_type"]["alerts"]["divergent_audits"] == 0
+    recent = {(record["id"], record["kind"]): record["fields"] for record in auditor.as_dict()["recent_divergent_records"]}
+    assert recent == {
+        ("job-1", drift.KIND_CHANGED): ["running"],
+        ("job-2", drift.KIND_STALE): [],
+        ("job-3", drift.KIND_MISSED): [],
+    }
+    assert auditor.interval == 300.0
+    assert auditor.divergence_rate == pytest.approx(0.2)
+
+
+def test_ignored_fields_do_not_count() -> None:
+    auditor = _auditor()
+    current = _index(hosts={"host-1": {"connected": True, "last_seen": "a"}})
+    fetched = _index(hosts={"host-1": {"connected": True, "last_seen": "b"}})
+    assert auditor.audit(current, fetched, drift.DRIFT_RECORD_TYPES) == 0
+
+
+def test_only_requested_record_types_are_audited() -> None:
+    auditor = _auditor()
+    current = _index(alerts={"alert-1": {"severity": "info"}})
+    fetched = _index(alerts={"alert-2": {"severity": "info"}})
+    assert auditor.audit(current, fetched, ("hosts", "jobs")) == 0
+    assert auditor.audit(current, fetched, ("alerts",)) == 2
+
+
+def test_interval_stays_within_bounds() -> None:
+    auditor = _auditor()
+    same = _index()
+    for _ in range(20):
+        auditor.audit(same, same, drift.DRIFT_RECORD_TYPES)
+    assert auditor.interval == 3600.0
+
+    diverged = _index(jobs={"job-1": {}})
+    for _ in range(20):
+        auditor.audit(same, diverged, drift.DRIFT_RECORD_TYPES)
+    assert auditor.interval == 30.0
+
+
+def test_interval_follows_the_divergence_rate() -> None:
+    auditor = _auditor()
+    same = _index()
+    diverged = _index(jobs={"job-1": {}})
+    auditor.audit(same, diverged, drift.DRIFT_RECORD_TYPES)
+    assert auditor.interval == 300.0
+    auditor.audit(same, diverged, drift.DRIFT_RECORD_TYPES)
+    assert auditor.divergence_rate == pytest.approx(0.36)
+    assert auditor.interval == 150.0
+    intervals = []
+    for _ in range(6):
+        auditor.audit(same, same, drift.DRIFT_RECORD_TYPES)
+        intervals.append(auditor.interval)
+    assert intervals == [150.0, 150.0, 150.0, 150.0, 150.0, 225.0]
+
+
+def test_configured_interval_above_max_raises_the_ceiling() -> None:
+    auditor = _auditor(interval=7200.0)
+    auditor.audit(_index(), _index(), drift.DRIFT_RECORD_TYPES)
+    assert auditor.interval == 7200.0
+
+
+def test_divergence_rate_is_an_ewma() -> None:
+    auditor = _auditor()
+    auditor.audit(_index(), _index(jobs={"job-1": {}}), drift.DRIFT_RECORD_TYPES)
+    auditor.audit(_index(), _index(), drift.DRIFT_RECORD_TYPES)
+    assert auditor.divergence_rate == pytest.approx(0.16)
+    auditor.record_skipped()
+    assert auditor.as_dict()["skipped_audits"] == 1
+    assert auditor.as_dict()["audits"] == 2
+    assert auditor.as_dict()["divergent_audits"] == 1
+
+
+def test_recent_records_are_bounded() -> None:
+    auditor = _auditor()
+    auditor.audit(_index(), _index(jobs={f"job-{i}": {} for i in range(5)}), drift.DRIFT_RECORD_TYPES)
+    assert len(auditor.as_dict()["recent_divergent_records"]) == 3
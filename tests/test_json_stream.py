@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from conftest import load_module
+
+js = load_module("json_stream")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "{}",
+        " { } ",
+        '{"schema_version": 1}',
+        '{"hosts": [], "jobs": [ ], "summary": {"running_jobs": 0}}',
+        '{"alerts": [{"id": "a", "tags": ["x", "y"]}, {"id": "b", "nested": {"list": [1, [2, 3]]}}]}',
+        '\n{\n  "a" : [ 1 , 2.5 , null , true , "s" ] ,\n  "b" : "caf\\u00e9"\n}\n',
+        '[1, 2, {"a": []}]',
+        '"text"',
+        "42",
+    ],
+)
+def test_matches_json_loads(text: str) -> None:
+    assert js.loads_incremental(text) == json.loads(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "{}garbage",
+        "{} {}",
+        '{"a": 1} x',
+        '{"a": [1, 2]}]',
+        "[1] 2",
+        '{"a": [1 2]}',
+        '{"a": [1,]}',
+        '{"a" 1}',
+        '{"a": 1 "b": 2}',
+        "{1: 2}",
+        '{"a": [1, 2}',
+        '{"a": 1',
+        "",
+    ],
+)
+def test_rejects_invalid_documents(text: str) -> None:
+    with pytest.raises(ValueError):
+        js.loads_incremental(text)
+
+
+def test_large_state_document() -> None:
+    payload = {
+        "schema_version": 1,
+        "summary": {"open_alerts_total": 500},
+        "hosts": [{"id": f"host-{i}", "connected": True} for i in range(50)],
+        "alerts": [{"id": f"alert-{i}", "severity": "info", "message": "é" * 10} for i in range(500)],
+    }
+    text = json.dumps(payload, indent=1, ensure_ascii=False)
+    assert js.loads_incremental(text) == payload
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from conftest import load_module
+
+ls = load_module("load_shedding")
+
+
+def _shedder() -> Any:
+    return ls.BixLoadShedder((50.0, 100.0, 200.0, 400.0), 0.6)
+
+
+@pytest.mark.parametrize(
+    ("lag_ms", "level"),
+    [
+        (0.0, ls.SHED_LEVEL_NONE),
+        (49.9, ls.SHED_LEVEL_NONE),
+        (50.0, ls.SHED_LEVEL_COALESCE_REFRESHES),
+        (150.0, ls.SHED_LEVEL_BATCH_WRITES),
+        (200.0, ls.SHED_LEVEL_SUSPEND_DIAGNOSTICS),
+        (5000.0, ls.SHED_LEVEL_SLOW_POLLS),
+    ],
+)
+def test_rises_straight_to_target_level(lag_ms: float, level: int) -> None:
+    shedder = _shedder()
+    assert shedder.update(lag_ms) is (level != ls.SHED_LEVEL_NONE)
+    assert shedder.level == level
+    assert shedder.level_name == ls.SHED_LEVEL_NAMES[level]
+
+
+def test_falls_only_below_exit_threshold() -> None:
+    shedder = _shedder()
+    shedder.update(250.0)
+    assert shedder.level == ls.SHED_LEVEL_SUSPEND_DIAGNOSTICS
+    assert not shedder.update(150.0)
+    assert not shedder.update(120.0)
+    assert shedder.update(119.0)
+    assert shedder.level == ls.SHED_LEVEL_BATCH_WRITES
+
+
+def test_falls_several_levels_at_once() -> None:
+    shedder = _shedder()
+    shedder.update(500.0)
+    assert shedder.update(10.0)
+    assert shedder.level == ls.SHED_LEVEL_NONE
+    assert shedder.max_level == ls.SHED_LEVEL_SLOW_POLLS
+    assert shedder.transitions == 2
+
+
+def test_hysteresis_keeps_level_between_thresholds() -> None:
+    shedder = _shedder()
+    shedder.update(60.0)
+    for lag_ms in (45.0, 31.0, 55.0, 30.0):
+        assert not shedder.update(lag_ms)
+        assert shedder.level == ls.SHED_LEVEL_COALESCE_REFRESHES
+    assert shedder.update(29.9)
+    assert shedder.level == ls.SHED_LEVEL_NONE
+
+
+def test_as_dict_reports_state() -> None:
+    shedder = _shedder()
+    assert shedder.as_dict()["seconds_in_level"] is None
+    shedder.update(100.0)
+    data = shedder.as_dict()
+    assert data["level"] == ls.SHED_LEVEL_BATCH_WRITES
+    assert data["level_name"] == "batch_entity_writes"
+    assert data["transitions"] == 1
+    assert data["seconds_in_level"] is not None
+    assert data["enter_ms"] == [50.0, 100.0, 200.0, 400.0]
+    assert data["exit_ratio"] == 0.6